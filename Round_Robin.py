@@ -1,131 +1,240 @@
 #!/usr/bin/env python3
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
+from tkinter import ttk, messagebox, filedialog
 from statistics import mean
-from PIL import Image, ImageTk
 import urllib.request
 import io
+import os
+import queue
 import random
+import threading
+
+from rr_cache import ResultCache, cache_key, workload_key
+from rr_compare import ComparisonRun, ComparisonTable, cached_cells, draw_heatmaps, parse_quanta
+from rr_core import SWITCH_COST_KINDS, round_robin, compute_extra_metrics, switch_cost_sampler
+from rr_instrument import Instrument
+from rr_policies import POLICY_NAMES, make_policy, simulate
+from rr_smp import SMP_MODES, round_robin_smp, smp_extra_metrics
+from rr_sweep import QuantumSweep, best_throughput, cached_points, quantum_range
+from rr_table import VirtualTable
+from rr_tasks import BackgroundTask
+from rr_timeline import Timeline
+from rr_workloads import WORKLOADS, make_workload, uniform
+
+LOGO_URL = "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcST0id_eprqxCoi1b9Eh6HQDuITVzdcBmyqMA&s"
+LOGO_SIZE = 60
+RR_LABEL_LIMIT = 50
+# A logo.png shipped next to this script wins over the cache and the network
+LOGO_BUNDLED = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
+LOGO_CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                          "round_robin", "logo.png")
+# Results of Run / Analyze / Compare, reused while the process table is unchanged
+RESULT_CACHE_DIR = os.path.join(os.path.dirname(LOGO_CACHE), "results")
+
+TASK_POLL_MS = 50
+PROGRESS_EVERY = 20000  # dispatches between progress reports from a running simulation
+
+COMPARE_LOAD = 0.9  # CPU load of the generated workloads in "Compare Quanta"
+# (heading, row key, format) of the comparison table
+COMPARE_COLUMNS = (("Workload", "workload", str), ("Q", "quantum", str),
+                   ("AWT", "avg_wt", "{:.2f}".format), ("ATAT", "avg_tat", "{:.2f}".format),
+                   ("p95 RT", "p95_rt", "{:.2f}".format), ("CS", "cs", str),
+                   ("CPU Util %", "cpu_util", "{:.2f}".format), ("Throughput", "throughput", "{:.4f}".format))
 
 # ---------------------
-# Core simulation (unchanged)
+# Embedded figures
 # ---------------------
-def round_robin(processes, quantum):
-    processes = sorted(processes, key=lambda x: x[1])
-    n = len(processes)
-    remaining = [bt for _, _, bt in processes]
-    completion = [0] * n
-    first_response = [-1] * n
-    time = 0
-    queue = []
-    visited = [False] * n
-    gantt = []
-
-    if processes and processes[0][1] > 0:
-        time = processes[0][1]
-
-    for idx in range(n):
-        if processes[idx][1] <= time and not visited[idx]:
-            queue.append(idx)
-            visited[idx] = True
-
-    if not queue:
-        for idx in range(n):
-            if not visited[idx]:
-                time = processes[idx][1]
-                queue.append(idx)
-                visited[idx] = True
-                break
-
-    while queue:
-        i = queue.pop(0)
-        if first_response[i] == -1:
-            first_response[i] = time - processes[i][1]
-
-        run_time = min(remaining[i], quantum)
-        start = time
-        end = time + run_time
-        gantt.append((processes[i][0], start, end))
-
-        time = end
-        remaining[i] -= run_time
-
-        for j in range(n):
-            if processes[j][1] <= time and not visited[j] and remaining[j] > 0:
-                queue.append(j)
-                visited[j] = True
-
-        if remaining[i] > 0:
-            queue.append(i)
-        else:
-            completion[i] = time
-
-        if not queue:
-            for k in range(n):
-                if remaining[k] > 0 and not visited[k]:
-                    time = processes[k][1]
-                    queue.append(k)
-                    visited[k] = True
-                    break
-
-    tat = [completion[i] - processes[i][1] for i in range(n)]
-    wt = [tat[i] - processes[i][2] for i in range(n)]
-    rt = [first_response[i] for i in range(n)]
-
-    cs = 0
-    for idx in range(1, len(gantt)):
-        if gantt[idx][0] != gantt[idx - 1][0]:
-            cs += 1
-
-    return processes, completion, tat, wt, rt, gantt, cs
-
-def compute_extra_metrics(processes, completion, tat, wt, rt, gantt):
-    n = len(processes)
-    total_burst = sum(p[2] for p in processes)
-    total_time = gantt[-1][2] if gantt else 0
-    cpu_util = (total_burst / total_time * 100) if total_time > 0 else 0
-    throughput = (n / total_time) if total_time > 0 else 0
-    response_ratios = [(tat[i] / processes[i][2]) if processes[i][2] > 0 else float('inf') for i in range(n)]
-    avg_rr = mean(response_ratios) if response_ratios else 0
-    return {
-        "total_time": total_time,
-        "total_burst": total_burst,
-        "cpu_util": cpu_util,
-        "throughput": throughput,
-        "response_ratios": response_ratios,
-        "avg_response_ratio": avg_rr
-    }
+# matplotlib is slow to import; load it on the first plot instead of at startup.
+# Figures are drawn on a FigureCanvasTkAgg inside our own windows rather than
+# through pyplot, so plotting never starts a second, blocking event loop.
+def _new_figure(figsize):
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+def _embed_canvas(fig, master):
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    frame = tk.Frame(master)
+    canvas = FigureCanvasTkAgg(fig, master=frame)
+    toolbar = NavigationToolbar2Tk(canvas, frame, pack_toolbar=False)
+    toolbar.update()
+    toolbar.pack(side="bottom", fill="x")
+    canvas.get_tk_widget().pack(side="top", fill="both", expand=True)
+    canvas.draw()
+    return frame, canvas
+
+def show_figure(fig, title):
+    win = tk.Toplevel(root)
+    win.title(title)
+    frame, _ = _embed_canvas(fig, win)
+    frame.pack(fill="both", expand=True)
+    return win
+
+# ---------------------
+# Background tasks
+# ---------------------
+# Simulations run on a worker thread (rr_tasks.BackgroundTask); the Tk loop
+# polls it, updates the status bar and draws the result once it is ready.
+# Starting another action cancels the one in progress.
+current_task = None
+
+def start_task(label, work, on_done):
+    global current_task
+    if current_task is not None and not current_task.done:
+        current_task.cancel()
+    task = BackgroundTask(work).start()
+    current_task = task
+    lbl_task.config(text=label + "...")
+    progress_bar.config(mode="indeterminate", value=0)
+    progress_bar.start(15)
+    btn_cancel_task.config(state="normal")
+    root.after(TASK_POLL_MS, _poll_task, task, label, on_done)
+
+def _poll_task(task, label, on_done):
+    latest = task.poll()
+    if task is not current_task:
+        return  # superseded by a newer action; its result is dropped
+    if latest is not None:
+        completed, total, text = latest
+        if total:
+            progress_bar.stop()
+            progress_bar.config(mode="determinate", value=100 * completed / total)
+            lbl_task.config(text=f"{label}: {completed}/{total} processes done ({text})")
+    if not task.done:
+        root.after(TASK_POLL_MS, _poll_task, task, label, on_done)
+        return
+
+    progress_bar.stop()
+    progress_bar.config(mode="determinate", value=0)
+    btn_cancel_task.config(state="disabled")
+    if task.cancelled.is_set():
+        lbl_task.config(text=f"{label}: cancelled.")
+    elif task.error is not None:
+        lbl_task.config(text=f"{label}: failed.")
+        messagebox.showerror("Error", str(task.error))
+    else:
+        lbl_task.config(text=f"{label}: done.")
+        try:
+            on_done(task.result)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+
+def cancel_task():
+    if current_task is not None and not current_task.done:
+        current_task.cancel()
+        lbl_task.config(text="Cancelling...")
+
+# ---------------------
+# Logo loading (off the main thread)
+# ---------------------
+def _decodes(raw_data):
+    # whether PIL can read raw_data as an image; without PIL this raises
+    # ImportError, as the logo could not be shown anyway
+    from PIL import Image
+    try:
+        Image.open(io.BytesIO(raw_data)).verify()
+        return True
+    except Exception:
+        return False
+
+def _fetch_logo_bytes():
+    for path in (LOGO_BUNDLED, LOGO_CACHE):
+        try:
+            with open(path, "rb") as f:
+                raw_data = f.read()
+        except OSError:
+            continue
+        if _decodes(raw_data):
+            return raw_data
+        if path == LOGO_CACHE:
+            # a truncated download or an error page: fetch it again
+            try:
+                os.remove(LOGO_CACHE)
+            except OSError:
+                pass
+    with urllib.request.urlopen(LOGO_URL, timeout=10) as u:
+        raw_data = u.read()
+    if not _decodes(raw_data):
+        raise ValueError("Logo download is not an image.")
+    try:
+        os.makedirs(os.path.dirname(LOGO_CACHE), exist_ok=True)
+        tmp = LOGO_CACHE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(raw_data)
+        os.replace(tmp, LOGO_CACHE)
+    except OSError:
+        pass
+    return raw_data
+
+def _logo_worker(results):
+    try:
+        results.put(_fetch_logo_bytes())
+    except Exception:
+        # offline or blocked: keep the placeholder
+        results.put(None)
+
+def _poll_logo(results, lbl_logo):
+    global logo_img
+    try:
+        raw_data = results.get_nowait()
+    except queue.Empty:
+        root.after(100, _poll_logo, results, lbl_logo)
+        return
+    if raw_data is None:
+        return
+    try:
+        from PIL import Image, ImageTk
+        img = Image.open(io.BytesIO(raw_data))
+        img = img.resize((LOGO_SIZE, LOGO_SIZE))
+        logo_img = ImageTk.PhotoImage(img)
+    except Exception:
+        return
+    lbl_logo.config(image=logo_img)
+
+def _placeholder_logo():
+    img = tk.PhotoImage(width=LOGO_SIZE, height=LOGO_SIZE)
+    img.put("#2E8BFF", to=(0, 0, LOGO_SIZE, LOGO_SIZE))
+    img.put("#F7FBFF", to=(18, 18, LOGO_SIZE - 18, LOGO_SIZE - 18))
+    return img
 
 # ---------------------
 # GUI actions
 # ---------------------
 def display_results_in_tree(procs, comp, tat, wt, rt):
-    # Clear old rows
-    for row in tree.get_children():
-        tree.delete(row)
-
-    # Insert rows with formatting
-    for i in range(len(procs)):
-        proc_id = procs[i][0]
-        at = procs[i][1]
-        bt = procs[i][2]
-        ct = comp[i]
-        tat_i = tat[i]
-        wt_i = wt[i]
+    # The table is virtualized: only the rows on screen are formatted, so
+    # this is O(visible rows) however many processes there are.
+    def row(i):
+        proc_id, at, bt = procs[i][0], procs[i][1], procs[i][2]
         rt_i = rt[i] if rt[i] >= 0 else 0  # display 0 instead of -1
+        return proc_id, at, bt, comp[i], tat[i], wt[i], rt_i
 
-        tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-        # Format everything as strings so columns align nicely
-        tree.insert("", "end", values=(
-            str(proc_id),
-            str(at),
-            str(bt),
-            str(ct),
-            str(tat_i),
-            str(wt_i),
-            str(rt_i)
-        ), tags=(tag,))
+    # sort keys are the result lists themselves, so nothing is copied up front
+    results_table.set_rows(len(procs), row, sort_keys={"CT": comp, "TAT": tat, "WT": wt, "RT": rt})
+
+def read_switch_cost():
+    # fixed number or per-switch sampler from the "Switch cost" settings
+    try:
+        cost = float(entry_switch.get().strip() or 0)
+        if cost < 0:
+            raise ValueError
+    except ValueError:
+        raise ValueError("Switch cost must be a non-negative number.")
+    return switch_cost_sampler(combo_switch.get(), cost)
+
+def read_priority(i):
+    # the Priority column of row i; lower numbers run first, blank means 0
+    raw = entries_pr[i].get().strip() if i < len(entries_pr) else ""
+    try:
+        return int(raw or 0)
+    except ValueError:
+        raise ValueError(f"Priority of P{i+1} must be an integer.")
+
+def cached_round_robin(processes, q, switch_cost=0, task=None):
+    # the Gantt comes back compressed, as a Timeline ready to draw; with a
+    # task, the run reports progress to it and stops when it is cancelled
+    instrument = Instrument(progress=task.progress, progress_every=PROGRESS_EVERY) if task else None
+    return result_cache.get_or_compute(cache_key(workload_key(processes), "RR", q, switch_cost),
+                                       lambda: round_robin(processes, q, compress=True, timeline=True,
+                                                           switch_cost=switch_cost, instrument=instrument))
 
 def run_scheduler():
     try:
@@ -157,51 +266,125 @@ def run_scheduler():
                 raise ValueError(f"Invalid values for P{i+1}: AT must be >=0 and BT must be >0.")
             processes.append(("P" + str(i + 1), at, bt))
 
-        procs, comp, tat, wt, rt, gantt, cs = round_robin(processes, q)
-        extras = compute_extra_metrics(procs, comp, tat, wt, rt, gantt)
-
-        display_results_in_tree(procs, comp, tat, wt, rt)
-
-        avg_wt = mean(wt) if wt else 0
-        avg_tat = mean(tat) if tat else 0
-
-        lbl_avg.config(text=f"ATAT: {avg_tat:.2f}   |   AWT: {avg_wt:.2f}   |   CS: {cs}")
-        lbl_extras.config(text=f"Total Time: {extras['total_time']}   CPU Util: {extras['cpu_util']:.2f}%   "
-                               f"Throughput: {extras['throughput']:.3f}/unit   Avg RespRatio: {extras['avg_response_ratio']:.2f}")
-
-        # Build RR text with one proc per line (wrap via label width)
-        rr_lines = []
-        for i in range(len(procs)):
-            rr_val = extras['response_ratios'][i]
-            rr_lines.append(f"{procs[i][0]}: {rr_val:.2f}")
-        rr_text = "   |   ".join(rr_lines)
-        lbl_rr.config(text=f"Response Ratios (per proc): {rr_text}")
-
-        show_gantt(gantt, title=f"Gantt (Quantum={q})", show_cs_lines=True)
-
+        try:
+            cpus = int(entry_cpus.get().strip() or 1)
+            if cpus <= 0:
+                raise ValueError
+        except ValueError:
+            raise ValueError("Number of CPUs must be a positive integer.")
+
+        switch_cost = read_switch_cost()
+        policy_name = combo_policy.get()
+        if policy_name == "Priority":
+            processes = [p + (read_priority(i),) for i, p in enumerate(processes)]
+        mode = combo_smp.get()
+        if cpus > 1 and policy_name != "RR":
+            raise ValueError("Multi-CPU simulation is only available for the RR policy.")
     except Exception as e:
         messagebox.showerror("Error", str(e))
+        return
+
+    def work(task):
+        # runs on the worker thread: simulate, then prepare everything the
+        # Tk thread needs so that it only has to draw
+        if cpus > 1:
+            # the lanes hold every slice, so they stay out of the disk tier
+            result = result_cache.get_or_compute(
+                cache_key(workload_key(processes), "smp", q, cpus, mode, switch_cost),
+                lambda: round_robin_smp(processes, q, cpus, mode, switch_cost=switch_cost,
+                                        progress=task.progress, progress_every=PROGRESS_EVERY),
+                disk=False)
+            task.check()
+            procs, comp, tat, wt, rt, lanes, _ = result
+            extras = smp_extra_metrics(procs, comp, tat, wt, rt, lanes)
+            charts = [Timeline.from_gantt(lane) for lane in lanes]
+        else:
+            if policy_name == "RR":
+                result = cached_round_robin(processes, q, switch_cost, task)
+            else:
+                result = result_cache.get_or_compute(
+                    cache_key(workload_key(processes), policy_name, q, switch_cost),
+                    lambda: simulate(processes, make_policy(policy_name, q), compress=True,
+                                     switch_cost=switch_cost, progress=task.progress,
+                                     progress_every=PROGRESS_EVERY))
+                task.check()
+            extras = compute_extra_metrics(*result[:6])
+            gantt = result[5]
+            charts = [gantt if isinstance(gantt, Timeline) else Timeline.from_gantt(gantt)]
+        return result, extras, charts
+
+    start_task("Running scheduler", work, lambda out: show_run_results(*out, q, policy_name))
+
+def show_run_results(result, extras, charts, q, policy_name):
+    procs, comp, tat, wt, rt, _, stats = result
+    smp_stats = stats if isinstance(stats, dict) else None
+    cs = smp_stats["cs"] if smp_stats is not None else stats
+
+    display_results_in_tree(procs, comp, tat, wt, rt)
+
+    avg_wt = mean(wt) if wt else 0
+    avg_tat = mean(tat) if tat else 0
+
+    lbl_avg.config(text=f"ATAT: {avg_tat:.2f}   |   AWT: {avg_wt:.2f}   |   CS: {cs}")
+    lbl_extras.config(text=f"Total Time: {extras['total_time']}   CPU Util: {extras['cpu_util']:.2f}%   "
+                           f"Throughput: {extras['throughput']:.3f}/unit   Avg RespRatio: {extras['avg_response_ratio']:.2f}")
+    if smp_stats is not None:
+        per_cpu = ", ".join(f"{u:.0f}%" for u in smp_stats["utilization"])
+        lbl_extras.config(text=lbl_extras.cget("text") +
+                          f"\nPer-CPU Util: {per_cpu}   CS per CPU: {smp_stats['cs_per_cpu']}   "
+                          f"Migrations: {smp_stats['migrations']}")
+
+    # Build RR text with one proc per line (wrap via label width); large
+    # runs only list the first few, the table has the rest
+    shown = min(len(procs), RR_LABEL_LIMIT)
+    rr_lines = []
+    for i in range(shown):
+        rr_val = extras['response_ratios'][i]
+        rr_lines.append(f"{procs[i][0]}: {rr_val:.2f}")
+    rr_text = "   |   ".join(rr_lines)
+    if shown < len(procs):
+        rr_text += f"   |   ... ({len(procs) - shown} more)"
+    lbl_rr.config(text=f"Response Ratios (per proc): {rr_text}")
+
+    if smp_stats is not None:
+        show_gantt_lanes(charts, title=f"Gantt (Quantum={q}, {smp_stats['cpus']} CPUs, {smp_stats['mode']} queue)")
+    else:
+        title = f"Gantt (Quantum={q})" if policy_name == "RR" else f"Gantt ({policy_name}, Quantum={q})"
+        show_gantt(charts[0], title=title, show_cs_lines=True)
 
 def show_gantt(gantt, title="Gantt Chart", show_cs_lines=True):
     if not gantt:
         messagebox.showinfo("Info", "No Gantt data to plot.")
         return
-    plt.figure(figsize=(10, 2.8))
-    colors = ["#FF6F61", "#6B5B95", "#88B04B", "#F7CAC9", "#92A8D1", "#955251", "#F4A460"]
-    for idx, (pid, s, e) in enumerate(gantt):
-        plt.barh(y=0, width=e - s, left=s, color=colors[idx % len(colors)], edgecolor="black")
-        plt.text((s + e) / 2, 0, pid, ha="center", va="center", color="white", fontsize=9, fontweight="bold")
-        if show_cs_lines and idx > 0:
-            plt.axvline(x=s, color="red", linestyle="--", linewidth=1)
-    start_time = gantt[0][1]
-    end_time = gantt[-1][2]
-    plt.title(title, fontsize=12, fontweight="bold")
-    plt.xlabel("Time")
-    plt.yticks([])
-    plt.xlim(left=max(0, start_time - 1), right=end_time + 1)
-    plt.grid(axis="x", linestyle="--", alpha=0.4)
-    plt.tight_layout()
-    plt.show()
+    from rr_gantt import GanttRenderer
+    fig = _new_figure((10, 2.8))
+    ax = fig.add_subplot()
+    GanttRenderer(ax, gantt, show_cs_lines=show_cs_lines)
+    ax.set_title(title, fontsize=12, fontweight="bold")
+    ax.set_xlabel("Time")
+    ax.set_yticks([])
+    ax.grid(axis="x", linestyle="--", alpha=0.4)
+    fig.tight_layout()
+    show_figure(fig, title)
+
+def show_gantt_lanes(lanes, title="Gantt Chart", show_cs_lines=True):
+    # one lane per CPU, CPU 0 on top
+    if not any(lanes):
+        messagebox.showinfo("Info", "No Gantt data to plot.")
+        return
+    from rr_gantt import GanttRenderer
+    fig = _new_figure((10, 1.2 + 0.7 * len(lanes)))
+    ax = fig.add_subplot()
+    for c, lane in enumerate(lanes):
+        GanttRenderer(ax, lane, y=-c, show_cs_lines=show_cs_lines)
+    ends = [lane[-1][2] for lane in lanes if lane]
+    ax.set_xlim(max(0, min(lane[0][1] for lane in lanes if lane) - 1), max(ends) + 1)
+    ax.set_yticks([-c for c in range(len(lanes))], [f"CPU {c}" for c in range(len(lanes))])
+    ax.set_title(title, fontsize=12, fontweight="bold")
+    ax.set_xlabel("Time")
+    ax.grid(axis="x", linestyle="--", alpha=0.4)
+    fig.tight_layout()
+    show_figure(fig, title)
 
 def analyze_quantum():
     try:
@@ -212,83 +395,261 @@ def analyze_quantum():
             bt = int(entries_bt[i].get())
             processes.append(("P" + str(i + 1), at, bt))
 
-        max_q = max((p[2] for p in processes), default=1) + 3
-        q_values = list(range(1, max_q))
-        avg_wt_list, avg_tat_list, cs_list = [], [], []
-
-        for q in q_values:
-            _, _, tat, wt, _, _, cs = round_robin(processes, q)
-            avg_wt_list.append(mean(wt) if wt else 0)
-            avg_tat_list.append(mean(tat) if tat else 0)
-            cs_list.append(cs)
-
-        plt.figure(figsize=(10, 5))
-        plt.plot(q_values, avg_wt_list, marker="o", label="Avg Waiting Time")
-        plt.plot(q_values, avg_tat_list, marker="s", label="Avg Turnaround Time")
-        plt.plot(q_values, cs_list, marker="^", label="Context Switches")
-        plt.title("Effect of Time Quantum on Performance", fontsize=13, fontweight="bold")
-        plt.xlabel("Time Quantum")
-        plt.ylabel("Value")
-        plt.legend()
-        plt.grid(True, linestyle="--", alpha=0.6)
-        plt.tight_layout()
-        plt.show()
+        max_q = max((p[2] for p in processes), default=1) + 2
+        open_sweep_window(processes, max_q, read_switch_cost())
 
     except Exception as e:
         messagebox.showerror("Error", str(e))
 
+def open_sweep_window(processes, default_max_q, switch_cost=0):
+    win = tk.Toplevel(root)
+    win.title("Analyze Quantum Effect")
+    win.configure(bg="#EAF6FF")
+    win.rowconfigure(2, weight=1)
+    win.columnconfigure(9, weight=1)
+
+    fields = {}
+    settings = (("Workers", os.cpu_count() or 1), ("Q from", 1), ("Q to", default_max_q), ("Step", 1))
+    for col, (label, default) in enumerate(settings):
+        tk.Label(win, text=label + ":", bg="#EAF6FF", font=("Arial", 10)).grid(row=0, column=2 * col, padx=4, pady=8)
+        entry = tk.Entry(win, width=7, font=("Arial", 10))
+        entry.insert(0, str(default))
+        entry.grid(row=0, column=2 * col + 1, padx=4)
+        fields[label] = entry
+
+    lbl_status = tk.Label(win, text="Set the range and press Start.", bg="#EAF6FF", font=("Arial", 9))
+    lbl_status.grid(row=1, column=0, columnspan=8, sticky="w", padx=6, pady=(0, 8))
+
+    state = {"sweep": None, "points": {}}
+
+    def redraw():
+        fig, lines = state["fig"], state["lines"]
+        if not win.winfo_exists():
+            return
+        qs = sorted(state["points"])
+        for k, line in enumerate(lines):
+            line.set_data(qs, [state["points"][q][k] for q in qs])
+        best = best_throughput([(q,) + state["points"][q] for q in qs])
+        if best is not None:
+            state["best"].set_data([best[0]], [best[4]])
+        for ax in fig.axes:
+            ax.relim()
+            ax.autoscale_view()
+        state["canvas"].draw_idle()
+
+    def poll(sweep):
+        if sweep is not state["sweep"] or sweep.cancelled:
+            return
+        try:
+            points = sweep.poll()
+        except Exception as e:
+            # a worker raised (or the pool broke): stop the run and say why
+            sweep.cancel()
+            lbl_status.config(text=f"Failed after {len(state['points'])}/{state['total']} quanta.")
+            btn_start.config(state="normal")
+            btn_cancel.config(state="disabled")
+            messagebox.showerror("Error", f"Sweep failed: {e}", parent=win)
+            return
+        for point in points:
+            result_cache.put(state["key"](point[0]), point, disk=False)
+            state["points"][point[0]] = point[1:]
+        redraw()
+        if sweep.done:
+            best = best_throughput([(q,) + v for q, v in state["points"].items()])
+            text = f"Done: {len(state['points'])} quanta ({sweep.completed} simulated, the rest cached)."
+            if best is not None:
+                text += f"  Best throughput: Q={best[0]} ({best[4]:.4f}/unit)"
+            lbl_status.config(text=text)
+            btn_start.config(state="normal")
+            btn_cancel.config(state="disabled")
+        else:
+            lbl_status.config(text=f"Running... {len(state['points'])}/{state['total']} quanta")
+            win.after(100, poll, sweep)
+
+    def start():
+        try:
+            workers = int(fields["Workers"].get())
+            if workers <= 0:
+                raise ValueError("Workers must be a positive integer.")
+            q_values = quantum_range(int(fields["Q from"].get()), int(fields["Q to"].get()),
+                                     int(fields["Step"].get()))
+        except ValueError as e:
+            messagebox.showerror("Error", str(e), parent=win)
+            return
+
+        fig = _new_figure((10, 5))
+        ax = fig.add_subplot()
+        lines = [ax.plot([], [], marker="o", label="Avg Waiting Time")[0],
+                 ax.plot([], [], marker="s", label="Avg Turnaround Time")[0],
+                 ax.plot([], [], marker="^", label="Context Switches")[0]]
+        # throughput is orders of magnitude smaller, so it gets its own axis
+        ax_tp = ax.twinx()
+        lines.append(ax_tp.plot([], [], color="#88B04B", marker="d", label="Throughput")[0])
+        best = ax_tp.plot([], [], linestyle="", marker="*", markersize=14, color="#FF6F61",
+                          label="Best throughput")[0]
+        title = "Effect of Time Quantum on Performance"
+        if switch_cost:
+            title += " (with switch cost)"
+        ax.set_title(title, fontsize=13, fontweight="bold")
+        ax.set_xlabel("Time Quantum")
+        ax.set_ylabel("Value")
+        ax_tp.set_ylabel("Throughput (processes/unit)")
+        handles = lines + [best]
+        ax.legend(handles, [h.get_label() for h in handles], loc="upper left")
+        ax.grid(True, linestyle="--", alpha=0.6)
+        fig.tight_layout()
+        # the plot lives in the sweep window, below the controls
+        if state.get("frame") is not None:
+            state["frame"].destroy()
+        frame, canvas = _embed_canvas(fig, win)
+        frame.grid(row=2, column=0, columnspan=10, sticky="nsew", padx=6, pady=(0, 6))
+        state.update(frame=frame, canvas=canvas)
+
+        # quanta already simulated for this table are taken from the cache
+        cached, missing, key = cached_points(result_cache, processes, q_values, switch_cost)
+        state.update(fig=fig, lines=lines, best=best, key=key, total=len(q_values),
+                     points={p[0]: p[1:] for p in cached})
+        state["sweep"] = QuantumSweep(processes, missing, workers, switch_cost=switch_cost).start()
+        btn_start.config(state="disabled")
+        btn_cancel.config(state="normal")
+        lbl_status.config(text=f"Running... {len(cached)}/{len(q_values)} quanta")
+        poll(state["sweep"])
+
+    def cancel():
+        sweep = state["sweep"]
+        if sweep is not None and not sweep.done:
+            sweep.cancel()
+            lbl_status.config(text=f"Cancelled after {len(state['points'])}/{state['total']} quanta.")
+        btn_start.config(state="normal")
+        btn_cancel.config(state="disabled")
+
+    def close():
+        cancel()
+        win.destroy()
+
+    btn_start = tk.Button(win, text="Start", command=start, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
+    btn_start.grid(row=0, column=8, padx=6)
+    btn_cancel = tk.Button(win, text="Cancel", command=cancel, state="disabled",
+                           bg="#955251", fg="white", font=("Arial", 10, "bold"))
+    btn_cancel.grid(row=0, column=9, padx=6)
+    win.protocol("WM_DELETE_WINDOW", close)
+
 def compare_quanta():
     try:
         n = int(entry_n.get())
-        q1 = int(entry_q1.get())
-        q2 = int(entry_q2.get())
-        if q1 <= 0 or q2 <= 0:
-            raise ValueError("Quantum values must be positive integers")
+        q_values = parse_quanta(entry_compare_q.get())
         processes = []
         for i in range(n):
             at = int(entries_at[i].get())
             bt = int(entries_bt[i].get())
             processes.append(("P" + str(i + 1), at, bt))
-
-        p1, comp1, tat1, wt1, rt1, gantt1, cs1 = round_robin(processes, q1)
-        p2, comp2, tat2, wt2, rt2, gantt2, cs2 = round_robin(processes, q2)
-
-        extras1 = compute_extra_metrics(p1, comp1, tat1, wt1, rt1, gantt1)
-        extras2 = compute_extra_metrics(p2, comp2, tat2, wt2, rt2, gantt2)
-
-        fig, axes = plt.subplots(2, 1, figsize=(10, 5), sharex=True)
-        colors = ["#FF6F61", "#6B5B95", "#88B04B", "#F7CAC9", "#92A8D1", "#955251"]
-        ax = axes[0]
-        for idx, (pid, s, e) in enumerate(gantt1):
-            ax.barh(y=0, width=e - s, left=s, color=colors[idx % len(colors)], edgecolor="black")
-            ax.text((s + e) / 2, 0, pid, ha="center", va="center", color="white", fontsize=8, fontweight="bold")
-            if idx > 0 and gantt1[idx][0] != gantt1[idx - 1][0]:
-                ax.axvline(x=s, color="red", linestyle="--", linewidth=1)
-        ax.set_title(f"Gantt (Q={q1}) -- CS:{cs1}  ATAT:{mean(tat1):.2f}  AWT:{mean(wt1):.2f}", fontsize=10)
-
-        ax = axes[1]
-        for idx, (pid, s, e) in enumerate(gantt2):
-            ax.barh(y=0, width=e - s, left=s, color=colors[idx % len(colors)], edgecolor="black")
-            ax.text((s + e) / 2, 0, pid, ha="center", va="center", color="white", fontsize=8, fontweight="bold")
-            if idx > 0 and gantt2[idx][0] != gantt2[idx - 1][0]:
-                ax.axvline(x=s, color="red", linestyle="--", linewidth=1)
-        ax.set_title(f"Gantt (Q={q2}) -- CS:{cs2}  ATAT:{mean(tat2):.2f}  AWT:{mean(wt2):.2f}", fontsize=10)
-
-        for ax in axes:
-            ax.set_yticks([])
-            ax.grid(axis="x", linestyle="--", alpha=0.4)
-
-        plt.tight_layout()
-        plt.show()
-
-        comp_msg = (
-            f"Quantum {q1} -> ATAT: {mean(tat1):.2f}, AWT: {mean(wt1):.2f}, CS: {cs1}, CPU Util: {extras1['cpu_util']:.2f}%\n"
-            f"Quantum {q2} -> ATAT: {mean(tat2):.2f}, AWT: {mean(wt2):.2f}, CS: {cs2}, CPU Util: {extras2['cpu_util']:.2f}%\n"
-        )
-        messagebox.showinfo("Comparison Results", comp_msg)
-
+        switch_cost = read_switch_cost()
     except Exception as e:
         messagebox.showerror("Error", str(e))
+        return
+
+    workloads = {"Process table": processes}
+    if var_compare_generated.get():
+        # same size as the table; fixed seeds so a rerun is served from the cache
+        for kind in WORKLOADS:
+            workloads[kind] = make_workload(kind, n, seed=0, load=COMPARE_LOAD)
+    open_compare_window(workloads, q_values, switch_cost)
+
+def open_compare_window(workloads, q_values, switch_cost=0):
+    win = tk.Toplevel(root)
+    win.title("Compare Quanta")
+    win.configure(bg="#EAF6FF")
+    win.rowconfigure(1, weight=1)
+    win.columnconfigure(0, weight=1)
+
+    bar = tk.Frame(win, bg="#EAF6FF")
+    bar.grid(row=0, column=0, sticky="ew", padx=6, pady=6)
+    lbl_status = tk.Label(bar, text="", bg="#EAF6FF", font=("Arial", 9))
+    lbl_status.pack(side="left")
+
+    # heatmaps above, the same cells as a sortable table below
+    fig = _new_figure((11, 6))
+    frame, canvas = _embed_canvas(fig, win)
+    frame.grid(row=1, column=0, sticky="nsew", padx=6)
+    frame_table = tk.Frame(win, bg="#EAF6FF")
+    frame_table.grid(row=2, column=0, sticky="ew", padx=6, pady=6)
+    table = VirtualTable(frame_table, [c[0] for c in COMPARE_COLUMNS], height=8, rowheight=24,
+                         widths={"Workload": 140}, anchors={"Workload": "w"})
+    table.pack(fill="both", expand=True)
+    table.tag_configure('oddrow', background="#EAF6FF")
+    table.tag_configure('evenrow', background="#FFFFFF")
+
+    # cells already simulated for these workloads are taken from the cache
+    cached, missing, key = cached_cells(result_cache, workloads, q_values, switch_cost)
+    results = ComparisonTable(cached)
+    total = len(workloads) * len(q_values)
+    run = ComparisonRun(workloads, missing, switch_cost=switch_cost).start()
+
+    def refresh():
+        draw_heatmaps(fig, results)
+        canvas.draw_idle()
+        rows = results.sorted_rows()
+        cell = lambda i: tuple(fmt(rows[i][k]) for _, k, fmt in COMPARE_COLUMNS)
+        table.set_rows(len(rows), cell, sort_keys={c: [r[k] for r in rows] for c, k, _ in COMPARE_COLUMNS})
+
+    def poll():
+        if run.cancelled or not win.winfo_exists():
+            return
+        try:
+            new = run.poll()
+        except Exception as e:
+            # a worker raised (or the pool broke): stop the run and say why
+            run.cancel()
+            lbl_status.config(text=f"Failed after {len(results)}/{total} cells.")
+            btn_cancel.config(state="disabled")
+            messagebox.showerror("Error", f"Comparison failed: {e}", parent=win)
+            return
+        if new:
+            for row in new:
+                result_cache.put(key(row["workload"], row["quantum"]), row, disk=False)
+            results.add(new)
+            refresh()
+        if run.done:
+            lbl_status.config(text=f"Done: {len(results)} cells ({run.completed} simulated, the rest cached). "
+                                   "Red outlines mark the best quantum per workload.")
+            btn_cancel.config(state="disabled")
+        else:
+            lbl_status.config(text=f"Running... {len(results)}/{total} cells")
+            win.after(100, poll)
+
+    def cancel():
+        if not run.done:
+            run.cancel()
+            lbl_status.config(text=f"Cancelled after {len(results)}/{total} cells.")
+        btn_cancel.config(state="disabled")
+
+    def export(ext):
+        path = filedialog.asksaveasfilename(parent=win, defaultextension=ext, initialfile="quanta" + ext,
+                                            filetypes=[(ext[1:].upper(), "*" + ext)])
+        if not path:
+            return
+        try:
+            if ext == ".parquet":
+                results.to_parquet(path)
+            else:
+                results.to_csv(path)
+        except (OSError, ImportError) as e:
+            messagebox.showerror("Export failed", str(e), parent=win)
+
+    def close():
+        cancel()
+        win.destroy()
+
+    for text, command in (("Export Parquet", lambda: export(".parquet")), ("Export CSV", lambda: export(".csv"))):
+        tk.Button(bar, text=text, command=command, bg="#256B9A", fg="white",
+                  font=("Arial", 10, "bold")).pack(side="right", padx=4)
+    btn_cancel = tk.Button(bar, text="Cancel", command=cancel, bg="#955251", fg="white", font=("Arial", 10, "bold"))
+    btn_cancel.pack(side="right", padx=4)
+    win.protocol("WM_DELETE_WINDOW", close)
+
+    if results.rows:
+        refresh()
+    poll()
 
 def show_info():
     info_win = tk.Toplevel(root)
@@ -314,7 +675,8 @@ def show_info():
     txt.insert("end", "3) Real-life examples:\n", "subheading")
     txt.insert("end", "   - Time-sharing systems and interactive OS schedulers use RR-like strategies to ensure fairness.\n\n", "normal")
     txt.insert("end", "4) Use the 'Analyze Quantum Effect' button to plot Avg Waiting Time, Avg Turnaround Time, and Context Switches\n", "subheading")
-    txt.insert("end", "   across a range of quantum values. Use 'Compare Quanta' to view two quanta side-by-side.\n\n", "normal")
+    txt.insert("end", "   across a range of quantum values. Use 'Compare Quanta' for a heatmap and table of many quanta, optionally\n"
+                      "   over generated workloads too, that can be exported as CSV or Parquet.\n\n", "normal")
     txt.insert("end", "5) Metrics explained:\n", "subheading")
     txt.insert("end", "   - ATAT: Average Turnaround Time = avg of (CT - AT)\n"
                       "   - AWT: Average Waiting Time = avg of (TAT - BT)\n"
@@ -329,70 +691,9 @@ def show_info():
     txt.pack(fill="both", expand=True)
 
 
-# ---------------------
-# Build GUI
-# ---------------------
-root = tk.Tk()
-root.title("Round Robin Scheduling Visualizer (Educational)")
-root.geometry("1050x800")
-root.configure(bg="#F7FBFF")
-
-# ---------------------
-# Logo + Title
-# ---------------------
-url = "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcST0id_eprqxCoi1b9Eh6HQDuITVzdcBmyqMA&s"
-with urllib.request.urlopen(url) as u:
-    raw_data = u.read()
-img = Image.open(io.BytesIO(raw_data))
-img = img.resize((60, 60))
-logo_img = ImageTk.PhotoImage(img)
-
-frame_title = tk.Frame(root, bg="#F7FBFF")
-frame_title.pack(fill="x", pady=(8, 0))
-
-lbl_logo = tk.Label(frame_title, image=logo_img, bg="#F7FBFF")
-lbl_logo.pack(side="left", padx=10)
-lbl_title = tk.Label(frame_title, text="Round Robin Scheduling Visualizer (Educational)",
-                     font=("Arial", 18, "bold"), bg="#F7FBFF", fg="#2E8BFF")
-lbl_title.pack(side="left")
-
-# ---------------------
-# Styles
-# ---------------------
-style = ttk.Style()
-style.theme_use("clam")
-style.configure("Treeview.Heading", font=("Arial", 11, "bold"),
-                foreground="white", background="#2E8BFF")
-style.map("Treeview.Heading",
-          background=[('active', '#1E90FF')])  # slight active color change
-style.configure("Treeview", font=("Arial", 10), rowheight=26)
-
-# Top frame for scheduler settings
-frame_top = tk.LabelFrame(root, text="Scheduler Settings", bg="#EAF6FF", font=("Arial", 12, "bold"), padx=8, pady=8)
-frame_top.pack(fill="x", padx=14, pady=10)
-
-tk.Label(frame_top, text="Number of Processes:", bg="#EAF6FF", font=("Arial", 11)).grid(row=0, column=0, sticky="w", padx=6, pady=6)
-entry_n = tk.Entry(frame_top, width=6, font=("Arial", 11))
-entry_n.grid(row=0, column=1, padx=6)
-tk.Label(frame_top, text="Time Quantum:", bg="#EAF6FF", font=("Arial", 11)).grid(row=0, column=2, sticky="w", padx=6, pady=6)
-entry_quantum = tk.Entry(frame_top, width=6, font=("Arial", 11))
-entry_quantum.grid(row=0, column=3, padx=6)
-
-btn_info = tk.Button(frame_top, text="Info Panel", command=show_info, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
-btn_info.grid(row=0, column=4, padx=8)
-btn_run_main = tk.Button(frame_top, text="Run Scheduler", command=run_scheduler, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
-btn_run_main.grid(row=0, column=5, padx=8)
-btn_analyze = tk.Button(frame_top, text="Analyze Quantum Effect", command=analyze_quantum, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
-btn_analyze.grid(row=0, column=6, padx=8)
-
-# ---------------------
-# Middle: process table
-# ---------------------
-frame_mid = tk.LabelFrame(root, text="Process Table (Arrival Time, Burst Time)", bg="#BDCDDE", font=("Arial", 12, "bold"), padx=8, pady=8)
-frame_mid.pack(fill="x", padx=14)
-
 entries_at = []
 entries_bt = []
+entries_pr = []
 
 def create_process_inputs():
     for widget in frame_mid.winfo_children():
@@ -411,9 +712,11 @@ def create_process_inputs():
     tk.Label(header, text="Process", width=12, bg="#2E8BFF", fg="white", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=4, pady=4)
     tk.Label(header, text="Arrival Time", width=16, bg="#4682B4", fg="white", font=("Arial", 10, "bold")).grid(row=0, column=1, padx=4, pady=4)
     tk.Label(header, text="Burst Time", width=16, bg="#4169E1", fg="white", font=("Arial", 10, "bold")).grid(row=0, column=2, padx=4, pady=4)
+    tk.Label(header, text="Priority", width=10, bg="#6A5ACD", fg="white", font=("Arial", 10, "bold")).grid(row=0, column=3, padx=4, pady=4)
 
     entries_at.clear()
     entries_bt.clear()
+    entries_pr.clear()
     for i in range(n):
         row = tk.Frame(frame_mid, bg="#F7FBFF")
         row.pack(fill="x", pady=2)
@@ -422,22 +725,26 @@ def create_process_inputs():
         bt = tk.Entry(row, width=18, font=("Arial", 10))
         at.grid(row=0, column=1, padx=4)
         bt.grid(row=0, column=2, padx=4)
+        pr = tk.Entry(row, width=10, font=("Arial", 10))
+        pr.grid(row=0, column=3, padx=4)
         entries_at.append(at)
         entries_bt.append(bt)
+        entries_pr.append(pr)
 
     # comparison inputs
     comp_frame = tk.Frame(frame_mid, bg="#F7FBFF")
     comp_frame.pack(fill="x", pady=6)
-    tk.Label(comp_frame, text="Compare Quantum Q1:", bg="#F7FBFF").grid(row=0, column=0, padx=6)
-    global entry_q1, entry_q2
-    entry_q1 = tk.Entry(comp_frame, width=6)
-    entry_q1.grid(row=0, column=1, padx=6)
-    tk.Label(comp_frame, text="with Q2:", bg="#F7FBFF").grid(row=0, column=2, padx=6)
-    entry_q2 = tk.Entry(comp_frame, width=6)
-    entry_q2.grid(row=0, column=3, padx=6)
+    tk.Label(comp_frame, text="Compare quanta:", bg="#F7FBFF").grid(row=0, column=0, padx=6)
+    global entry_compare_q, var_compare_generated
+    entry_compare_q = tk.Entry(comp_frame, width=18)
+    entry_compare_q.insert(0, "1, 2, 4, 8, 16")
+    entry_compare_q.grid(row=0, column=1, padx=6)
+    var_compare_generated = tk.BooleanVar(value=False)
+    tk.Checkbutton(comp_frame, text="also on generated workloads (" + ", ".join(WORKLOADS) + ")",
+                   variable=var_compare_generated, bg="#F7FBFF").grid(row=0, column=2, padx=6)
     btn_compare = tk.Button(comp_frame, text="Compare Quanta", command=compare_quanta,
                         bg="#9DB84B", fg="white", font=("Arial", 10, "bold"), activebackground="#9DB84B")
-    btn_compare.grid(row=0, column=4, padx=8)
+    btn_compare.grid(row=0, column=3, padx=8)
 
     # random-fill button
     sample_btn = tk.Button(frame_mid, text="Fill Random Data", command=fill_random_example,
@@ -449,66 +756,153 @@ def fill_random_example():
         n = int(entry_n.get())
         if n < 1:
             return
-        for i in range(n):
-            if i < len(entries_at):
-                entries_at[i].delete(0, tk.END)
-                entries_bt[i].delete(0, tk.END)
-                entries_at[i].insert(0, str(random.randint(0, 5)))
-                entries_bt[i].insert(0, str(random.randint(1, 10)))
+        for i, (_, at, bt) in enumerate(uniform(min(n, len(entries_at)))):
+            entries_at[i].delete(0, tk.END)
+            entries_bt[i].delete(0, tk.END)
+            entries_at[i].insert(0, str(at))
+            entries_bt[i].insert(0, str(bt))
+            entries_pr[i].delete(0, tk.END)
+            entries_pr[i].insert(0, str(random.randint(1, 5)))
     except:
         pass
 
-btn_create = tk.Button(frame_top, text="Create Table Inputs", command=create_process_inputs, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
-btn_create.grid(row=0, column=7, padx=8)
-
 # ---------------------
-# Bottom: results
+# Build GUI
 # ---------------------
-frame_bottom = tk.LabelFrame(root, text="Results", bg="#EAF6FF", font=("Arial", 12, "bold"), padx=8, pady=8)
-frame_bottom.pack(fill="both", expand=True, padx=12, pady=10)
-
-# Treeview setup
-cols = ("Process", "AT", "BT", "CT", "TAT", "WT", "RT")
-tree = ttk.Treeview(frame_bottom, columns=cols, show="headings", height=8)
-
-for c in cols:
-    tree.heading(c, text=c)
-# column widths and anchor: Process left, others center
-tree.column("Process", width=120, anchor="w")
-tree.column("AT", width=90, anchor="center")
-tree.column("BT", width=90, anchor="center")
-tree.column("CT", width=100, anchor="center")
-tree.column("TAT", width=100, anchor="center")
-tree.column("WT", width=100, anchor="center")
-tree.column("RT", width=90, anchor="center")
-
-# add a vertical scrollbar for the tree
-vsb = ttk.Scrollbar(frame_bottom, orient="vertical", command=tree.yview)
-tree.configure(yscrollcommand=vsb.set)
-vsb.pack(side="right", fill="y")
-tree.pack(fill="both", expand=True, padx=6, pady=6)
-
-# Style (already configured above)
-style.configure("Treeview", background="#FFFFFF", fieldbackground="#FFFFFF", foreground="black")
-style.configure("Treeview.Heading", font=("Arial", 11, "bold"))
-
-# Alternate row colors
-tree.tag_configure('oddrow', background="#EAF6FF")
-tree.tag_configure('evenrow', background="#FFFFFF")
-
-# Labels
-lbl_avg = tk.Label(frame_bottom, text="ATAT: -   |   AWT: -   |   CS: -",
-                   font=("Arial", 10, "bold"), bg="#EAF6FF", fg="darkred")
-lbl_avg.pack(pady=4)
-
-lbl_extras = tk.Label(frame_bottom, text="Total Time: -   CPU Util: -   Throughput: -   Avg RespRatio: -",
-                      font=("Arial", 9), bg="#EAF6FF")
-lbl_extras.pack(pady=2)
-
-lbl_rr = tk.Label(frame_bottom, text="Response Ratios (per proc): -",
-                  font=("Arial", 9), bg="#EAF6FF", wraplength=920, justify="left")
-lbl_rr.pack(fill="x", pady=2, padx=4)
-
-# start GUI
-
-root.mainloop()
+def main():
+    global root, result_cache, logo_img, entry_n, entry_quantum, combo_policy, entry_cpus, combo_smp, entry_switch, combo_switch, frame_mid, results_table, lbl_task, progress_bar, btn_cancel_task, lbl_avg, lbl_extras, lbl_rr
+    root = tk.Tk()
+    result_cache = ResultCache(disk_dir=RESULT_CACHE_DIR)
+    root.title("Round Robin Scheduling Visualizer (Educational)")
+    root.geometry("1050x800")
+    root.configure(bg="#F7FBFF")
+
+    # ---------------------
+    # Logo + Title
+    # ---------------------
+    # Show a placeholder right away; the real logo is swapped in once the
+    # background thread has read it from disk or the network.
+    logo_img = _placeholder_logo()
+
+    frame_title = tk.Frame(root, bg="#F7FBFF")
+    frame_title.pack(fill="x", pady=(8, 0))
+
+    lbl_logo = tk.Label(frame_title, image=logo_img, bg="#F7FBFF")
+    lbl_logo.pack(side="left", padx=10)
+    logo_results = queue.Queue()
+    threading.Thread(target=_logo_worker, args=(logo_results,), daemon=True).start()
+    root.after(100, _poll_logo, logo_results, lbl_logo)
+    lbl_title = tk.Label(frame_title, text="Round Robin Scheduling Visualizer (Educational)",
+                         font=("Arial", 18, "bold"), bg="#F7FBFF", fg="#2E8BFF")
+    lbl_title.pack(side="left")
+
+    # ---------------------
+    # Styles
+    # ---------------------
+    style = ttk.Style()
+    style.theme_use("clam")
+    style.configure("Treeview.Heading", font=("Arial", 11, "bold"),
+                    foreground="white", background="#2E8BFF")
+    style.map("Treeview.Heading",
+              background=[('active', '#1E90FF')])  # slight active color change
+    style.configure("Treeview", font=("Arial", 10), rowheight=26)
+
+    # Top frame for scheduler settings
+    frame_top = tk.LabelFrame(root, text="Scheduler Settings", bg="#EAF6FF", font=("Arial", 12, "bold"), padx=8, pady=8)
+    frame_top.pack(fill="x", padx=14, pady=10)
+
+    tk.Label(frame_top, text="Number of Processes:", bg="#EAF6FF", font=("Arial", 11)).grid(row=0, column=0, sticky="w", padx=6, pady=6)
+    entry_n = tk.Entry(frame_top, width=6, font=("Arial", 11))
+    entry_n.grid(row=0, column=1, padx=6)
+    tk.Label(frame_top, text="Time Quantum:", bg="#EAF6FF", font=("Arial", 11)).grid(row=0, column=2, sticky="w", padx=6, pady=6)
+    entry_quantum = tk.Entry(frame_top, width=6, font=("Arial", 11))
+    entry_quantum.grid(row=0, column=3, padx=6)
+    tk.Label(frame_top, text="Policy:", bg="#EAF6FF", font=("Arial", 11)).grid(row=1, column=0, sticky="w", padx=6, pady=6)
+    combo_policy = ttk.Combobox(frame_top, values=POLICY_NAMES, state="readonly", width=9, font=("Arial", 11))
+    combo_policy.set("RR")
+    combo_policy.grid(row=1, column=1, sticky="w", padx=6)
+    tk.Label(frame_top, text="CPUs:", bg="#EAF6FF", font=("Arial", 11)).grid(row=1, column=2, sticky="w", padx=6, pady=6)
+    entry_cpus = tk.Entry(frame_top, width=6, font=("Arial", 11))
+    entry_cpus.insert(0, "1")
+    entry_cpus.grid(row=1, column=3, padx=6)
+    combo_smp = ttk.Combobox(frame_top, values=SMP_MODES, state="readonly", width=9, font=("Arial", 11))
+    combo_smp.set("global")
+    combo_smp.grid(row=1, column=4, sticky="w", padx=8)
+    tk.Label(frame_top, text="Switch cost:", bg="#EAF6FF", font=("Arial", 11)).grid(row=1, column=5, sticky="w", padx=6, pady=6)
+    entry_switch = tk.Entry(frame_top, width=6, font=("Arial", 11))
+    entry_switch.insert(0, "0")
+    entry_switch.grid(row=1, column=6, padx=6)
+    combo_switch = ttk.Combobox(frame_top, values=SWITCH_COST_KINDS, state="readonly", width=11, font=("Arial", 11))
+    combo_switch.set("fixed")
+    combo_switch.grid(row=1, column=7, sticky="w", padx=8)
+
+    btn_info = tk.Button(frame_top, text="Info Panel", command=show_info, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
+    btn_info.grid(row=0, column=4, padx=8)
+    btn_run_main = tk.Button(frame_top, text="Run Scheduler", command=run_scheduler, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
+    btn_run_main.grid(row=0, column=5, padx=8)
+    btn_analyze = tk.Button(frame_top, text="Analyze Quantum Effect", command=analyze_quantum, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
+    btn_analyze.grid(row=0, column=6, padx=8)
+
+    # ---------------------
+    # Middle: process table
+    # ---------------------
+    frame_mid = tk.LabelFrame(root, text="Process Table (Arrival Time, Burst Time, Priority)", bg="#BDCDDE", font=("Arial", 12, "bold"), padx=8, pady=8)
+    frame_mid.pack(fill="x", padx=14)
+
+    btn_create = tk.Button(frame_top, text="Create Table Inputs", command=create_process_inputs, bg="#256B9A", fg="white", font=("Arial", 10, "bold"))
+    btn_create.grid(row=0, column=7, padx=8)
+
+    # ---------------------
+    # Status bar: progress of the running action
+    # ---------------------
+    frame_status = tk.Frame(root, bg="#F7FBFF")
+    frame_status.pack(side="bottom", fill="x", padx=14, pady=(0, 8))
+    progress_bar = ttk.Progressbar(frame_status, length=240, mode="determinate", maximum=100)
+    progress_bar.pack(side="left", padx=(0, 8))
+    btn_cancel_task = tk.Button(frame_status, text="Cancel", command=cancel_task, state="disabled",
+                                bg="#955251", fg="white", font=("Arial", 9, "bold"))
+    btn_cancel_task.pack(side="left", padx=(0, 8))
+    lbl_task = tk.Label(frame_status, text="Ready.", bg="#F7FBFF", font=("Arial", 9), anchor="w")
+    lbl_task.pack(side="left", fill="x", expand=True)
+
+    # ---------------------
+    # Bottom: results
+    # ---------------------
+    frame_bottom = tk.LabelFrame(root, text="Results", bg="#EAF6FF", font=("Arial", 12, "bold"), padx=8, pady=8)
+    frame_bottom.pack(fill="both", expand=True, padx=12, pady=10)
+
+    # Treeview setup (virtualized, see rr_table)
+    cols = ("Process", "AT", "BT", "CT", "TAT", "WT", "RT")
+    # column widths and anchor: Process left, others center
+    results_table = VirtualTable(frame_bottom, cols, height=8, rowheight=26,
+                                 widths={"Process": 120, "AT": 90, "BT": 90, "CT": 100,
+                                         "TAT": 100, "WT": 100, "RT": 90},
+                                 anchors={"Process": "w"})
+    results_table.pack(fill="both", expand=True, padx=6, pady=6)
+
+    # Style (already configured above)
+    style.configure("Treeview", background="#FFFFFF", fieldbackground="#FFFFFF", foreground="black")
+    style.configure("Treeview.Heading", font=("Arial", 11, "bold"))
+
+    # Alternate row colors
+    results_table.tag_configure('oddrow', background="#EAF6FF")
+    results_table.tag_configure('evenrow', background="#FFFFFF")
+
+    # Labels
+    lbl_avg = tk.Label(frame_bottom, text="ATAT: -   |   AWT: -   |   CS: -",
+                       font=("Arial", 10, "bold"), bg="#EAF6FF", fg="darkred")
+    lbl_avg.pack(pady=4)
+
+    lbl_extras = tk.Label(frame_bottom, text="Total Time: -   CPU Util: -   Throughput: -   Avg RespRatio: -",
+                          font=("Arial", 9), bg="#EAF6FF")
+    lbl_extras.pack(pady=2)
+
+    lbl_rr = tk.Label(frame_bottom, text="Response Ratios (per proc): -",
+                      font=("Arial", 9), bg="#EAF6FF", wraplength=920, justify="left")
+    lbl_rr.pack(fill="x", pady=2, padx=4)
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for round_robin() and compute_extra_metrics().
+
+    python benchmarks/bench_core.py -o results.json
+    python benchmarks/bench_core.py --max-n 100000 --compare results.json
+
+For every workload kind, process count (10^2 .. --max-n) and quantum it
+records the best wall time of each function over --repeat runs, the
+tracemalloc peak of one simulation plus metrics, and Gantt slices per
+second. Results are written as JSON; --compare prints the time ratios
+against an earlier results file (> 1 means slower now).
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rr_core import compute_extra_metrics, round_robin  # noqa: E402
+from rr_workloads import WORKLOADS, make_workload  # noqa: E402
+
+def best_time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+def peak_memory(processes, quantum):
+    tracemalloc.start()
+    try:
+        result = round_robin(processes, quantum)
+        compute_extra_metrics(*result[:6])
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_case(kind, n, quantum, args):
+    processes = make_workload(kind, n, seed=args.seed, load=args.load)
+    t_rr, result = best_time(lambda: round_robin(processes, quantum), args.repeat)
+    t_metrics, _ = best_time(lambda: compute_extra_metrics(*result[:6]), args.repeat)
+    slices = len(result[5])
+    return {
+        "workload": kind,
+        "n": n,
+        "quantum": quantum,
+        "seed": args.seed,
+        "slices": slices,
+        "cs": result[6],
+        "total_time": result[5][-1][2] if slices else 0,
+        "round_robin_s": t_rr,
+        "metrics_s": t_metrics,
+        "slices_per_s": slices / t_rr if t_rr > 0 else 0,
+        "peak_bytes": None if args.no_memory else peak_memory(processes, quantum),
+    }
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        old = {(r["workload"], r["n"], r["quantum"]): r for r in json.load(f)["results"]}
+    print(f"\nvs {baseline_path} (ratio = now / then)")
+    print(f"{'workload':>8} {'n':>8} {'q':>5} {'round_robin':>12} {'metrics':>9} {'peak mem':>9}")
+    for r in results:
+        o = old.get((r["workload"], r["n"], r["quantum"]))
+        if o is None:
+            continue
+        mem = (f"{r['peak_bytes'] / o['peak_bytes']:9.2f}"
+               if r["peak_bytes"] and o.get("peak_bytes") else f"{'-':>9}")
+        print(f"{r['workload']:>8} {r['n']:>8} {r['quantum']:>5} {r['round_robin_s'] / o['round_robin_s']:12.2f} "
+              f"{r['metrics_s'] / o['metrics_s']:9.2f} {mem}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS), default=sorted(WORKLOADS))
+    parser.add_argument("--min-n", type=int, default=100)
+    parser.add_argument("--max-n", type=int, default=1000000, help="process counts are powers of 10 up to this")
+    parser.add_argument("--quanta", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--load", type=float, default=0.9, help="target CPU load of the generated arrivals")
+    parser.add_argument("--repeat", type=int, default=3, help="time each case this many times, keep the best")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = []
+    n = args.min_n
+    while n <= args.max_n:
+        sizes.append(n)
+        n *= 10
+
+    results = []
+    print(f"{'workload':>8} {'n':>8} {'q':>5} {'slices':>10} {'rr s':>9} {'metrics s':>10} "
+          f"{'slices/s':>11} {'peak MiB':>9}")
+    for kind in args.workloads:
+        for n in sizes:
+            for q in args.quanta:
+                r = bench_case(kind, n, q, args)
+                results.append(r)
+                peak = f"{r['peak_bytes'] / 2 ** 20:9.1f}" if r["peak_bytes"] is not None else f"{'-':>9}"
+                print(f"{kind:>8} {n:>8} {q:>5} {r['slices']:>10} {r['round_robin_s']:9.3f} "
+                      f"{r['metrics_s']:10.4f} {r['slices_per_s']:11.0f} {peak}", flush=True)
+
+    report = {
+        "benchmark": "bench_core",
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
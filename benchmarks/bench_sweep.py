@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Shared quantum sweep vs. one simulation per quantum.
+
+    python benchmarks/bench_sweep.py                  # 10^5 processes, quanta 1..1000
+    python benchmarks/bench_sweep.py --workload pareto --load 0.7
+    python benchmarks/bench_sweep.py --load 2         # overloaded: one long busy period
+
+The baseline is sweep_metrics(processes, [q]) for each q: the same
+Gantt-free engine, with no sharing between quanta. The sweep shares each
+busy period among the quanta that do not change its schedule, so the gain
+grows with the number of busy periods. An overloaded trace is a single
+busy period and only its common prefix is shared. --with-gantt also times
+quantum_point(), which records a compressed Gantt chart. At 10^5
+processes and quantum 1 that chart takes several GiB.
+The per-quantum runs take hours over the full range at the largest
+sizes, so by default they are timed on an evenly spaced sample of quanta
+and extrapolated; pass --baseline-sample 0 to run them in full.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rr_sweep import quantum_point, sweep_metrics  # noqa: E402
+from rr_workloads import WORKLOADS, make_workload  # noqa: E402
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=100000, help="number of processes")
+    parser.add_argument("--quanta", type=int, default=1000, help="sweep quanta 1..QUANTA")
+    parser.add_argument("--max-burst", type=int, default=None, help="default: QUANTA - 2, like the GUI sweep")
+    parser.add_argument("--workload", choices=WORKLOADS, default="uniform")
+    parser.add_argument("--load", type=float, default=0.9, help="average CPU load of the trace")
+    parser.add_argument("--baseline-sample", type=int, default=20,
+                        help="quanta to time the baseline on (0 = all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--with-gantt", action="store_true", help="also time quantum_point(), which keeps a Gantt chart")
+    args = parser.parse_args(argv)
+
+    max_burst = args.max_burst or max(1, args.quanta - 2)
+    processes = make_workload(args.workload, args.n, seed=args.seed, load=args.load, max_burst=max_burst)
+    q_values = list(range(1, args.quanta + 1))
+
+    t0 = time.perf_counter()
+    shared = sweep_metrics(processes, q_values)
+    t_shared = time.perf_counter() - t0
+
+    if args.baseline_sample and args.baseline_sample < len(q_values):
+        step = len(q_values) / args.baseline_sample
+        sample = sorted({q_values[int(k * step)] for k in range(args.baseline_sample)})
+    else:
+        sample = q_values
+    t0 = time.perf_counter()
+    baseline = [sweep_metrics(processes, [q])[0] for q in sample]
+    t_baseline = (time.perf_counter() - t0) * len(q_values) / len(sample)
+    with_gantt, t_gantt = [], None
+    if args.with_gantt:
+        t0 = time.perf_counter()
+        with_gantt = [quantum_point(processes, q) for q in sample]
+        t_gantt = (time.perf_counter() - t0) * len(q_values) / len(sample)
+
+    by_q = {p[0]: p for p in shared}
+    for q, avg_wt, avg_tat, cs, _ in baseline + with_gantt:
+        _, s_wt, s_tat, s_cs, _ = by_q[q]
+        if s_cs != cs or abs(s_wt - avg_wt) > 1e-6 * max(1, abs(avg_wt)) or abs(s_tat - avg_tat) > 1e-6 * max(1, abs(avg_tat)):
+            raise SystemExit(f"metrics differ at quantum {q}")
+
+    estimated = "" if sample is q_values else f" (estimated from {len(sample)} quanta)"
+    print(f"{args.workload} n={args.n} load={args.load} quanta=1..{args.quanta} max_burst={max_burst}")
+    print(f"per-quantum, no Gantt:   {t_baseline:9.2f} s{estimated}")
+    if t_gantt is not None:
+        print(f"per-quantum, with Gantt: {t_gantt:9.2f} s{estimated}")
+    print(f"shared sweep:            {t_shared:9.2f} s")
+    print(f"speedup vs no Gantt:     {t_baseline / t_shared:9.1f}x")
+    if t_gantt is not None:
+        print(f"speedup vs with Gantt:   {t_gantt / t_shared:9.1f}x")
+
+if __name__ == "__main__":
+    main()
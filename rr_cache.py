@@ -0,0 +1,212 @@
+"""Memoized simulation results, keyed by workload content and parameters.
+
+A key is a hash of the process table (pid, arrival, burst in order) plus
+the parameters of the run, such as ("rr", quantum, switch_cost). Editing
+one row of the table gives a new workload hash. Results cached for other
+tables are untouched, and the stale ones age out of the LRU.
+
+ResultCache keeps recent results in memory, bounded by entry count and
+approximate size. It can also spill them to a directory of pickles that
+is bounded by total file size and evicts the least recently used files.
+Cached values are shared, so treat them as read-only.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+
+def workload_key(processes):
+    # content hash of a process table; row order matters (ties in arrival
+    # time are served in input order)
+    h = hashlib.blake2b(digest_size=16)
+    for proc in processes:
+        h.update(repr(tuple(proc)).encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+def cache_key(workload, *params):
+    """Key for a result of `workload` (a workload_key()) run with params.
+
+    Returns None when a parameter is callable, e.g. a random switch cost
+    sampler: such runs are not repeatable and are never cached.
+    """
+    if any(callable(p) for p in params):
+        return None
+    h = hashlib.blake2b(workload.encode(), digest_size=16)
+    h.update(repr(params).encode())
+    return h.hexdigest()
+
+def _approx_size(obj, depth=0):
+    # rough in-memory size: containers are sized from their first element,
+    # array-backed values such as a Timeline by their nbytes
+    size = sys.getsizeof(obj) + getattr(obj, "nbytes", 0)
+    if depth < 4 and isinstance(obj, (list, tuple)) and obj:
+        if isinstance(obj, tuple) and len(obj) < 16:
+            size += sum(_approx_size(x, depth + 1) for x in obj)
+        else:
+            size += len(obj) * _approx_size(obj[0], depth + 1)
+    return size
+
+class ResultCache:
+    """LRU cache of simulation results with an optional disk tier.
+
+    max_entries and max_bytes bound the memory tier (sizes are estimates).
+    With disk_dir set, results are also pickled there (unless put with
+    disk=False) and the folder is kept under disk_max_bytes. A memory miss that hits on disk brings
+    the result back into memory. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries=4096, max_bytes=256 * 2 ** 20, disk_dir=None, disk_max_bytes=512 * 2 ** 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._disk_bytes = None  # total size of the disk tier, computed on first write
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key is not None and (key in self._entries or (self.disk_dir is not None and os.path.exists(self._path(key))))
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits,
+                "disk_hits": self.disk_hits, "misses": self.misses}
+
+    def get(self, key, default=None):
+        if key is None:
+            return default
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        value = self._disk_get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.disk_hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key, value, disk=True):
+        # disk=False keeps small, cheap-to-recompute values out of the disk tier
+        if key is None:
+            return
+        self._remember(key, value)
+        if disk:
+            self._disk_put(key, value)
+
+    def get_or_compute(self, key, compute, disk=True):
+        # the cached result for key, or compute() stored under it
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value, disk)
+        return value
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_dir is not None:
+            for name, _, _ in self._disk_files():
+                try:
+                    os.remove(os.path.join(self.disk_dir, name))
+                except OSError:
+                    pass
+            self._disk_bytes = 0
+
+    def _remember(self, key, value):
+        size = _approx_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    # ---------------------
+    # Disk tier
+    # ---------------------
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key + ".pkl")
+
+    def _disk_files(self):
+        # [(name, size, mtime)] of the cached pickles
+        files = []
+        try:
+            with os.scandir(self.disk_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".pkl"):
+                        st = entry.stat()
+                        files.append((entry.name, st.st_size, st.st_mtime))
+        except OSError:
+            pass
+        return files
+
+    def _disk_get(self, key):
+        if self.disk_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # mark as recently used
+            return value
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _disk_put(self, key, value):
+        # the size estimate turns away results far too big for the folder
+        # before they are pickled
+        if self.disk_dir is None or _approx_size(value) > self.disk_max_bytes:
+            return
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(data) > self.disk_max_bytes:
+                return
+            os.makedirs(self.disk_dir, exist_ok=True)
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._disk_evict()
+
+    def _disk_evict(self):
+        # drop least recently used files until the folder is 90% of the limit
+        files = sorted(self._disk_files(), key=lambda f: f[2])
+        total = sum(size for _, size, _ in files)
+        target = self.disk_max_bytes * 0.9
+        for name, size, _ in files:
+            if total <= target:
+                break
+            try:
+                os.remove(os.path.join(self.disk_dir, name))
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
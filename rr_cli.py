@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Batch Round Robin runner for process traces.
+
+    python rr_cli.py trace.csv -q 4 > results.csv
+    zcat trace.jsonl.gz | python rr_cli.py - -q 4 --input-format jsonl --format jsonl
+
+Traces are CSV with a header (pid, arrival, burst; "at"/"bt" also
+accepted, pid optional) or JSON Lines with the same keys. Per-process
+results are written as each process completes, and the summary metrics
+go to stderr at the end. Input sorted by arrival is processed in bounded
+memory; --sort lifts that requirement by loading the whole trace first.
+"""
+import argparse
+import csv
+import json
+import math
+import sys
+
+from rr_stream import RECORD_FIELDS, StreamSummary, iter_round_robin
+
+_ALIASES = {
+    "pid": ("pid", "process", "id"),
+    "arrival": ("arrival", "at", "arrival_time"),
+    "burst": ("burst", "bt", "burst_time"),
+}
+
+def _number(raw, field, line):
+    # JSON numbers pass through as they are; strings (CSV, quoted JSON) keep
+    # integers exact and fall back to float. inf and nan are rejected, as no
+    # schedule can be built from them.
+    value = None
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        value = raw
+    elif isinstance(raw, str):
+        try:
+            value = int(raw)
+        except ValueError:
+            try:
+                value = float(raw)
+            except ValueError:
+                pass
+    if value is None:
+        raise ValueError(f"line {line}: invalid {field} value {raw!r}")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"line {line}: {field} must be a finite number, got {raw!r}")
+    return value
+
+def _pick(row, field, line):
+    for key in _ALIASES[field]:
+        if key in row and row[key] not in (None, ""):
+            return row[key]
+    if field == "pid":
+        return None
+    raise ValueError(f"line {line}: missing {field}")
+
+def _record(row, line, number):
+    # number is the record's position in the trace, used for unnamed processes
+    pid = _pick(row, "pid", line)
+    at = _number(_pick(row, "arrival", line), "arrival", line)
+    bt = _number(_pick(row, "burst", line), "burst", line)
+    if at < 0 or bt <= 0:
+        raise ValueError(f"line {line}: AT must be >=0 and BT must be >0")
+    return (str(pid) if pid is not None else f"P{number}", at, bt)
+
+def read_trace(stream, fmt):
+    """Yield (pid, arrival, burst) records from a CSV or JSONL stream."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        if reader.fieldnames:
+            reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for number, row in enumerate(reader, start=1):
+            yield _record(row, reader.line_num, number)
+    else:
+        number = 0
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                obj = json.loads(text)
+            except ValueError as e:
+                raise ValueError(f"line {line}: invalid JSON ({e})")
+            if not isinstance(obj, dict):
+                raise ValueError(f"line {line}: expected a JSON object, got {type(obj).__name__}")
+            number += 1
+            yield _record({k.lower(): v for k, v in obj.items()}, line, number)
+
+def _format_from_name(name):
+    return "jsonl" if name.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+class _RecordWriter:
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.fmt = fmt
+        if fmt == "csv":
+            self._csv = csv.writer(stream)
+            self._csv.writerow(RECORD_FIELDS)
+
+    def write(self, record):
+        if self.fmt == "csv":
+            self._csv.writerow(record)
+        else:
+            self.stream.write(json.dumps(dict(zip(RECORD_FIELDS, record))) + "\n")
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Stream a process trace through the Round Robin scheduler.")
+    parser.add_argument("trace", help="trace file, or - for stdin")
+    parser.add_argument("-q", "--quantum", type=int, required=True, help="time quantum (positive integer)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"), help="default: from the file extension, csv for stdin")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="per-process output format")
+    parser.add_argument("-o", "--output", default="-", help="per-process results file (default: stdout)")
+    parser.add_argument("--summary-only", action="store_true", help="skip per-process output")
+    parser.add_argument("--sort", action="store_true",
+                        help="sort the trace by arrival first (loads the whole trace into memory)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.quantum <= 0:
+        print("error: time quantum must be a positive integer", file=sys.stderr)
+        return 2
+
+    in_fmt = args.input_format or ("csv" if args.trace == "-" else _format_from_name(args.trace))
+    source = sink = None
+    summary = StreamSummary()
+    try:
+        source = sys.stdin if args.trace == "-" else open(args.trace, newline="")
+        sink = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+        records = read_trace(source, in_fmt)
+        if args.sort:
+            records = sorted(records, key=lambda r: r[1])
+        writer = None if args.summary_only else _RecordWriter(sink, args.format)
+        for record in iter_round_robin(records, args.quantum, summary):
+            if writer is not None:
+                writer.write(record)
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not None and source is not sys.stdin:
+            source.close()
+        if sink is not None and sink is not sys.stdout:
+            sink.close()
+
+    print(json.dumps(summary.as_dict()), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
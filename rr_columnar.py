@@ -0,0 +1,120 @@
+"""Columnar (NumPy) view of scheduling results.
+
+Optional: needs numpy, which the GUI and rr_core do not. Each process
+costs a few fixed-width array slots instead of several tuples and
+lists. All metrics, including the tail-latency percentiles, are computed
+with vectorized operations.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from rr_core import round_robin
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("rr_columnar needs numpy: pip install numpy")
+
+def _column(values):
+    col = np.asarray(values)
+    # plain ints stay int64, anything else (floats, mixed) becomes float64
+    return col.astype(np.int64 if col.dtype.kind in "iub" else np.float64, copy=False)
+
+class ProcessTable:
+    """One row per process, stored column-wise.
+
+    pids is a fixed-width string array. completion and first_response are
+    None until the table holds a result; first_response is -1 for a process
+    that never got the CPU, as in round_robin().
+    """
+
+    __slots__ = ("pids", "arrival", "burst", "completion", "first_response")
+
+    def __init__(self, pids, arrival, burst, completion=None, first_response=None):
+        _require_numpy()
+        self.pids = np.asarray(pids, dtype=str)
+        self.arrival = _column(arrival)
+        self.burst = _column(burst)
+        self.completion = None if completion is None else _column(completion)
+        self.first_response = None if first_response is None else _column(first_response)
+
+    @classmethod
+    def from_processes(cls, processes):
+        # extra fields, such as a priority, are ignored
+        pids, arrival, burst = zip(*(p[:3] for p in processes)) if processes else ((), (), ())
+        return cls(pids, arrival, burst)
+
+    @classmethod
+    def from_result(cls, procs, completion, tat, wt, rt):
+        # same argument order as display_results_in_tree(); tat and wt are
+        # derived columns and are recomputed on demand
+        table = cls.from_processes(procs)
+        table.completion = _column(completion)
+        table.first_response = _column(rt)
+        return table
+
+    def __len__(self):
+        return len(self.arrival)
+
+    @property
+    def tat(self):
+        return self.completion - self.arrival
+
+    @property
+    def wt(self):
+        return self.completion - self.arrival - self.burst
+
+    @property
+    def rt(self):
+        return self.first_response
+
+    @property
+    def response_ratios(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = self.tat / self.burst
+        return np.where(self.burst > 0, ratios, np.inf)
+
+    def percentiles(self, column, q=DEFAULT_PERCENTILES):
+        values = getattr(self, column)
+        if not len(values):
+            return {p: 0 for p in q}
+        return dict(zip(q, np.percentile(values, q).tolist()))
+
+    def metrics(self, total_time=None, percentiles=DEFAULT_PERCENTILES):
+        """compute_extra_metrics() keys plus averages and wt/rt percentiles.
+
+        total_time defaults to the last completion, which is where the
+        Gantt chart of a round_robin() run ends.
+        """
+        n = len(self)
+        if total_time is None:
+            total_time = self.completion.max().item() if n else 0
+        total_burst = self.burst.sum().item()
+        response_ratios = self.response_ratios
+        out = {
+            "total_time": total_time,
+            "total_burst": total_burst,
+            "cpu_util": (total_burst / total_time * 100) if total_time > 0 else 0,
+            "throughput": (n / total_time) if total_time > 0 else 0,
+            "response_ratios": response_ratios,
+            "avg_response_ratio": response_ratios.mean().item() if n else 0,
+            "avg_tat": self.tat.mean().item() if n else 0,
+            "avg_wt": self.wt.mean().item() if n else 0,
+            "avg_rt": self.rt.mean().item() if n else 0,
+        }
+        for column in ("wt", "rt"):
+            for p, value in self.percentiles(column, percentiles).items():
+                out[f"p{p}_{column}"] = value
+        return out
+
+def round_robin_table(processes, quantum, compress=True):
+    """round_robin() with the per-process results returned as a ProcessTable.
+
+    Returns (table, gantt, cs); the Gantt is compressed by default since
+    callers that want columns usually want the compact schedule too.
+    """
+    procs, completion, tat, wt, rt, gantt, cs = round_robin(processes, quantum, compress=compress)
+    return ProcessTable.from_result(procs, completion, tat, wt, rt), gantt, cs
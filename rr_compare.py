@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Compare many quanta over many workloads: one row per (workload, quantum).
+
+    python rr_compare.py trace.csv pareto:5000 bursty:5000:7 -q 1 2 4 8 16 32 -o matrix.csv
+    python rr_compare.py uniform:20000 -q 1-64:4 -o matrix.parquet
+
+A workload is a trace file (CSV or JSON Lines, as for rr_cli.py) or a
+generated one, kind:n[:seed] with kind from rr_workloads. Cells are
+simulated concurrently on a process pool (see rr_sweep.PoolRun) and
+collected in a ComparisonTable, which can be drawn as heatmaps and saved
+as CSV or, with pyarrow installed, Parquet.
+
+Headless like rr_sweep, with the same caveat about spawned workers
+re-importing __main__. matplotlib is only imported when draw_heatmaps()
+draws.
+"""
+import argparse
+import csv
+import math
+import sys
+from statistics import fmean
+
+from rr_cache import cache_key, workload_key
+from rr_core import percentile, round_robin
+from rr_sweep import PoolRun, quantum_range
+
+# metric -> (label, higher is better)
+METRICS = {
+    "avg_wt": ("Avg waiting time", False),
+    "avg_tat": ("Avg turnaround time", False),
+    "avg_rt": ("Avg response time", False),
+    "p95_rt": ("p95 response time", False),
+    "cs": ("Context switches", False),
+    "cpu_util": ("CPU utilization (%)", True),
+    "throughput": ("Throughput", True),
+}
+COLUMNS = ("workload", "quantum") + tuple(METRICS)
+HEATMAP_METRICS = ("avg_wt", "avg_tat", "cs", "cpu_util", "p95_rt")
+
+def parse_quanta(text):
+    """Sorted quanta from a field like "2, 4, 8", "1-16" or "4-64:4" (ranges are inclusive)."""
+    q_values = set()
+    for token in text.replace(",", " ").split():
+        start, dash, rest = token.partition("-")
+        stop, _, step = rest.partition(":")
+        try:
+            if dash:
+                start, stop, step = int(start), int(stop), int(step or 1)
+            else:
+                q = int(token)
+        except ValueError:
+            raise ValueError(f"Bad quantum {token!r}; use values like 4 or ranges like 1-16 and 4-64:4.") from None
+        if dash:
+            q_values.update(quantum_range(start, stop, step))
+        else:
+            q_values.add(q)
+    if not q_values:
+        raise ValueError("Enter at least one quantum, e.g. 2, 4, 8 or 1-16.")
+    if min(q_values) <= 0:
+        raise ValueError("Quantum values must be positive integers.")
+    return sorted(q_values)
+
+def cell_metrics(processes, quantum, switch_cost=0):
+    # one (workload, quantum) cell, without the workload name
+    procs, _, tat, wt, rt, gantt, cs = round_robin(processes, quantum, compress=True, switch_cost=switch_cost)
+    total_time = gantt[-1][2] if gantt else 0
+    total_burst = sum(p[2] for p in procs)
+    return {
+        "quantum": quantum,
+        "avg_wt": fmean(wt) if wt else 0,
+        "avg_tat": fmean(tat) if tat else 0,
+        "avg_rt": fmean(rt) if rt else 0,
+        "p95_rt": percentile(sorted(rt), 95),
+        "cs": cs,
+        "cpu_util": (total_burst / total_time * 100) if total_time > 0 else 0,
+        "throughput": (len(procs) / total_time) if total_time > 0 else 0,
+    }
+
+def _compare_chunk(name, processes, q_values, switch_cost):
+    return [dict(cell_metrics(processes, q, switch_cost), workload=name) for q in q_values]
+
+class ComparisonRun(PoolRun):
+    """cell_metrics() for every (workload, quantum) on a pool of workers.
+
+    workloads maps a name to a process list. q_values is one list of quanta
+    for all of them, or a dict giving each workload its own. poll() returns
+    row dicts (see COLUMNS) as cells finish.
+    """
+
+    def __init__(self, workloads, q_values, workers=None, chunks_per_worker=4, switch_cost=0):
+        super().__init__(workers, chunks_per_worker)
+        self.workloads = {name: list(procs) for name, procs in workloads.items()}
+        if isinstance(q_values, dict):
+            self.q_values = {name: list(q_values.get(name, ())) for name in self.workloads}
+        else:
+            self.q_values = dict.fromkeys(self.workloads, list(q_values))
+        self.switch_cost = switch_cost
+
+    @property
+    def total(self):
+        return sum(len(qs) for qs in self.q_values.values())
+
+    def _jobs(self):
+        # split each workload's quanta so that all workers stay busy
+        busy = [name for name, qs in self.q_values.items() if qs]
+        per_workload = -(-self.workers * self.chunks_per_worker // max(1, len(busy)))
+        jobs = []
+        for name in busy:
+            qs = self.q_values[name]
+            n_chunks = max(1, min(len(qs), per_workload))
+            jobs.extend((_compare_chunk, (name, self.workloads[name], qs[k::n_chunks], self.switch_cost))
+                        for k in range(n_chunks))
+        return jobs
+
+class ComparisonTable:
+    """Rows of a comparison, addressable as a workload x quantum grid."""
+
+    def __init__(self, rows=()):
+        self.rows = []
+        self._index = {}
+        self.add(rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, rows):
+        for row in rows:
+            key = (row["workload"], row["quantum"])
+            if key in self._index:
+                self.rows[self._index[key]] = row
+            else:
+                self._index[key] = len(self.rows)
+                self.rows.append(row)
+
+    @property
+    def workloads(self):
+        # in the order they first appeared
+        return list(dict.fromkeys(row["workload"] for row in self.rows))
+
+    @property
+    def quanta(self):
+        return sorted({row["quantum"] for row in self.rows})
+
+    def cell(self, workload, quantum):
+        i = self._index.get((workload, quantum))
+        return None if i is None else self.rows[i]
+
+    def matrix(self, metric):
+        """(workloads, quanta, grid) with grid[i][j] the metric, nan if missing."""
+        workloads, quanta = self.workloads, self.quanta
+        grid = []
+        for name in workloads:
+            cells = (self.cell(name, q) for q in quanta)
+            grid.append([math.nan if row is None else row[metric] for row in cells])
+        return workloads, quanta, grid
+
+    def best(self, metric):
+        # {workload: row} with the best value of metric (smallest quantum on ties)
+        higher = METRICS[metric][1]
+        best = {}
+        for row in sorted(self.rows, key=lambda r: r["quantum"]):
+            current = best.get(row["workload"])
+            if current is None or (row[metric] > current[metric] if higher else row[metric] < current[metric]):
+                best[row["workload"]] = row
+        return best
+
+    def sorted_rows(self):
+        order = {name: i for i, name in enumerate(self.workloads)}
+        return sorted(self.rows, key=lambda r: (order[r["workload"]], r["quantum"]))
+
+    def to_csv(self, target):
+        # target is a path or an open text stream
+        if hasattr(target, "write"):
+            self._write_csv(target)
+        else:
+            with open(target, "w", newline="") as f:
+                self._write_csv(f)
+
+    def _write_csv(self, stream):
+        writer = csv.DictWriter(stream, fieldnames=COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(self.sorted_rows())
+
+    def to_parquet(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from None
+        rows = self.sorted_rows()
+        pq.write_table(pa.table({col: [row[col] for row in rows] for col in COLUMNS}), path)
+
+    def save(self, path):
+        # format from the extension: .parquet or CSV
+        if path.lower().endswith((".parquet", ".pq")):
+            self.to_parquet(path)
+        else:
+            self.to_csv(path)
+
+def cached_cells(cache, workloads, q_values, switch_cost=0):
+    """Split a comparison into the rows a ResultCache already holds and the rest.
+
+    Returns (rows, missing, key): missing maps each workload name to the
+    quanta still to simulate, and key(name, q) is the cache key to store a
+    newly computed row under.
+    """
+    hashes = {name: workload_key(procs) for name, procs in workloads.items()}
+    # the name is not part of the key: renaming a workload keeps its cells
+    key = lambda name, q: cache_key(hashes[name], "cell", q, switch_cost)
+    rows, missing = [], {}
+    for name in workloads:
+        missing[name] = []
+        for q in q_values:
+            row = cache.get(key(name, q))
+            if row is None:
+                missing[name].append(q)
+            else:
+                rows.append(dict(row, workload=name))
+    return rows, missing, key
+
+def run_comparison(workloads, q_values, workers=None, switch_cost=0, cache=None):
+    # blocking convenience wrapper for scripts; returns a ComparisonTable.
+    # With a ResultCache only the cells it does not hold yet are simulated.
+    if cache is not None:
+        rows, missing, key = cached_cells(cache, workloads, q_values, switch_cost)
+    else:
+        rows, missing = [], q_values
+    table = ComparisonTable(rows)
+    run = ComparisonRun(workloads, missing, workers, switch_cost=switch_cost).start()
+    while not run.done:
+        new = run.wait()
+        if cache is not None:
+            for row in new:
+                cache.put(key(row["workload"], row["quantum"]), row, disk=False)
+        table.add(new)
+    return table
+
+# ---------------------
+# Heatmaps
+# ---------------------
+def _format_value(value):
+    if isinstance(value, float) and math.isnan(value):
+        return ""
+    if float(value).is_integer():
+        return str(int(value))
+    return f"{value:.3g}" if abs(value) < 100 else f"{value:.0f}"
+
+def draw_heatmaps(fig, table, metrics=HEATMAP_METRICS, annotate_max=150):
+    """One heatmap per metric on a matplotlib Figure, workloads down, quanta across.
+
+    Colours are scaled per workload, from best (dark) to worst (light), so
+    workloads of very different sizes can share a plot; the best cell of
+    each row is outlined. Cells carry their values while there are at most
+    annotate_max of them.
+    """
+    fig.clear()
+    if not len(table):
+        return []
+    workloads, quanta = table.workloads, table.quanta
+    cols = min(len(metrics), 3 if len(metrics) > 4 else 2)
+    rows = -(-len(metrics) // cols)
+    axes = []
+    for k, metric in enumerate(metrics):
+        ax = fig.add_subplot(rows, cols, k + 1)
+        axes.append(ax)
+        label, higher = METRICS[metric]
+        _, _, grid = table.matrix(metric)
+        shade = []
+        for values in grid:
+            present = [v for v in values if not math.isnan(v)]
+            lo, hi = (min(present), max(present)) if present else (0, 0)
+            span = hi - lo
+            # 0 = best, 1 = worst
+            shade.append([math.nan if math.isnan(v) else
+                          ((hi - v) if higher else (v - lo)) / span if span else 0.0 for v in values])
+        ax.imshow(shade, aspect="auto", cmap="viridis", vmin=0, vmax=1, interpolation="nearest")
+        ax.set_title(label, fontsize=9)
+        step = max(1, len(quanta) // 16)
+        ax.set_xticks(range(0, len(quanta), step))
+        ax.set_xticklabels([quanta[j] for j in range(0, len(quanta), step)], fontsize=7)
+        ax.set_yticks(range(len(workloads)))
+        ax.set_yticklabels(workloads, fontsize=7)
+        ax.set_xlabel("Quantum", fontsize=8)
+
+        best = table.best(metric)
+        for i, name in enumerate(workloads):
+            j = quanta.index(best[name]["quantum"])
+            ax.add_patch(_outline(j, i))
+        if len(workloads) * len(quanta) <= annotate_max:
+            for i, values in enumerate(grid):
+                for j, v in enumerate(values):
+                    if not math.isnan(v):
+                        ax.text(j, i, _format_value(v), ha="center", va="center", fontsize=6,
+                                color="white" if shade[i][j] < 0.5 else "black")
+    fig.tight_layout()
+    return axes
+
+def _outline(x, y):
+    # imported here so that worker processes never load matplotlib
+    from matplotlib.patches import Rectangle
+    return Rectangle((x - 0.5, y - 0.5), 1, 1, fill=False, edgecolor="red", linewidth=1.5)
+
+# ---------------------
+# Command line
+# ---------------------
+def load_workload(spec, load=0.9):
+    """(name, processes) for a trace path or a kind:n[:seed] generator spec."""
+    from rr_workloads import WORKLOADS, make_workload
+    kind, _, rest = spec.partition(":")
+    if kind in WORKLOADS and rest:
+        n, _, seed = rest.partition(":")
+        try:
+            return spec, make_workload(kind, int(n), seed=int(seed) if seed else 0, load=load)
+        except ValueError:
+            raise ValueError(f"bad workload spec {spec!r}; expected {kind}:n[:seed]") from None
+    from rr_cli import _format_from_name, read_trace
+    with open(spec, newline="") as f:
+        return spec, list(read_trace(f, _format_from_name(spec)))
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Compare Round Robin quanta across workloads.")
+    parser.add_argument("workloads", nargs="+", help="trace files and/or kind:n[:seed] (uniform, pareto, bursty)")
+    parser.add_argument("-q", "--quanta", nargs="+", required=True,
+                        help="quanta to compare: values and inclusive ranges like 1-16 or 4-64:4")
+    parser.add_argument("--switch-cost", type=float, default=0.0, help="fixed context-switch cost")
+    parser.add_argument("--load", type=float, default=0.9, help="target CPU load of generated workloads")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all CPUs)")
+    parser.add_argument("-o", "--output", default="-", help="CSV, or .parquet, file (default: CSV on stdout)")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        q_values = parse_quanta(" ".join(args.quanta))
+        workloads = dict(load_workload(spec, args.load) for spec in args.workloads)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    switch_cost = int(args.switch_cost) if args.switch_cost.is_integer() else args.switch_cost
+
+    table = run_comparison(workloads, q_values, args.workers, switch_cost=switch_cost)
+    if args.output == "-":
+        table.to_csv(sys.stdout)
+    else:
+        table.save(args.output)
+    best = {metric: table.best(metric) for metric in HEATMAP_METRICS}
+    for name in table.workloads:
+        picks = ", ".join(f"{metric} q={best[metric][name]['quantum']}" for metric in HEATMAP_METRICS)
+        print(f"{name}: best {picks}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""Headless Round Robin scheduling core.
+
+Importable from batch jobs, workers and tests: no tkinter, matplotlib or
+PIL imports here. The GUI lives in Round_Robin.py.
+"""
+import random
+from collections import deque
+from statistics import fmean
+
+from rr_timeline import SWITCH, Timeline
+
+# ---------------------
+# Core simulation
+# ---------------------
+def round_robin(processes, quantum, compress=False, timeline=False, switch_cost=0, instrument=None):
+    # compress=True merges back-to-back slices of the same process into a
+    # single Gantt segment; metrics and the context-switch count are the same
+    # either way. timeline=True returns the Gantt as a compact array-backed
+    # rr_timeline.Timeline instead of a list of tuples. switch_cost (a number,
+    # or a callable returning one per switch) charges every context switch
+    # as a (SWITCH, start, end) segment before the incoming slice.
+    # instrument is an optional rr_instrument.Instrument that collects
+    # counters and timings for the run.
+    processes = sorted(processes, key=lambda x: x[1])
+    n = len(processes)
+    pids = [p[0] for p in processes]
+    arrival = [p[1] for p in processes]
+    state = _RRState(arrival, [p[2] for p in processes])
+    if timeline:
+        integral = (type(quantum) is int and type(switch_cost) is int
+                    and all(type(p[1]) is int and type(p[2]) is int for p in processes))
+        gantt = Timeline(pids, "q" if integral else "d")
+    else:
+        gantt = []
+    _advance(state, pids, arrival, quantum, gantt, compress, switch_cost=switch_cost, instrument=instrument)
+
+    completion = state.completion
+    tat = [completion[i] - arrival[i] for i in range(n)]
+    wt = [tat[i] - processes[i][2] for i in range(n)]
+    rt = state.first_response
+
+    return processes, completion, tat, wt, rt, gantt, state.cs
+
+class _RRState:
+    # Everything needed to resume a simulation part-way through, so a quantum
+    # sweep can share the schedule prefix that several quanta have in common.
+    __slots__ = ("time", "nxt", "queue", "remaining", "completion", "first_response",
+                 "cs", "last_pid", "completion_sum")
+
+    def __init__(self, arrival, remaining):
+        n = len(arrival)
+        self.time = 0
+        self.queue = deque()
+        self.remaining = remaining
+        self.completion = [0] * n
+        self.first_response = [-1] * n
+        self.cs = 0
+        self.last_pid = None
+        self.completion_sum = 0
+        # processes[:nxt] have been admitted to the queue (or skipped because
+        # they have nothing left to run); arrivals are consumed in sorted order
+        self.nxt = 0
+
+        if n and arrival[0] > 0:
+            self.time = arrival[0]
+
+        while self.nxt < n and arrival[self.nxt] <= self.time:
+            self.queue.append(self.nxt)
+            self.nxt += 1
+
+    def copy(self):
+        other = _RRState.__new__(_RRState)
+        other.time = self.time
+        other.nxt = self.nxt
+        other.queue = deque(self.queue)
+        other.remaining = self.remaining[:]
+        other.completion = self.completion[:]
+        other.first_response = self.first_response[:]
+        other.cs = self.cs
+        other.last_pid = self.last_pid
+        other.completion_sum = self.completion_sum
+        return other
+
+def _advance(state, pids, arrival, quantum, gantt=None, compress=False, limit=None, switch_cost=0,
+             instrument=None):
+    # Run the simulation in `state` forward. gantt=None skips recording the
+    # schedule. With a limit, stop before dispatching a process whose
+    # remaining burst exceeds it (the point where quanta <= limit diverge).
+    # An rr_instrument.Instrument hears about every dispatch; without one
+    # the loop only tests the `hooks` flag once per dispatch.
+    hooks = instrument is not None
+    if hooks:
+        arrival, gantt = instrument._begin(state, arrival, gantt)
+    n = len(arrival)
+    time = state.time
+    nxt = state.nxt
+    queue = state.queue
+    remaining = state.remaining
+    completion = state.completion
+    first_response = state.first_response
+    cs = state.cs
+    last_pid = state.last_pid
+    completion_sum = state.completion_sum
+    record = gantt is not None
+    sample_cost = switch_cost if callable(switch_cost) else None
+
+    while queue:
+        if limit is not None and remaining[queue[0]] > limit:
+            break
+        i = queue.popleft()
+
+        pid = pids[i]
+        if last_pid is not None and pid != last_pid:
+            cs += 1
+            if switch_cost:
+                cost = sample_cost() if sample_cost else switch_cost
+                if record and cost > 0:
+                    gantt.append((SWITCH, time, time + cost))
+                time += cost
+        last_pid = pid
+
+        if first_response[i] == -1:
+            first_response[i] = time - arrival[i]
+
+        if not queue and quantum > 0 and remaining[i] > quantum:
+            # Only process i is runnable: it keeps the CPU slice after slice
+            # until it finishes or the next arrival lands on a slice boundary,
+            # so skip straight to its last uninterrupted full slice.
+            skip = int(-(-remaining[i] // quantum)) - 1
+            if nxt < n:
+                skip = min(skip, int(-((time - arrival[nxt]) // quantum)) - 1)
+            if skip > 0:
+                if hooks:
+                    instrument._skipped(skip)
+                if record:
+                    if compress:
+                        _append_merged(gantt, pid, time, time + skip * quantum)
+                    else:
+                        gantt.extend((pid, time + k * quantum, time + (k + 1) * quantum) for k in range(skip))
+                time += skip * quantum
+                remaining[i] -= skip * quantum
+
+        run_time = min(remaining[i], quantum)
+        end = time + run_time
+        if record:
+            if compress:
+                _append_merged(gantt, pid, time, end)
+            else:
+                gantt.append((pid, time, end))
+
+        time = end
+        remaining[i] -= run_time
+
+        while nxt < n and arrival[nxt] <= time:
+            if remaining[nxt] > 0:
+                queue.append(nxt)
+            nxt += 1
+
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = time
+            completion_sum += time
+
+        if not queue:
+            # CPU goes idle: jump to the next process that still has work
+            while nxt < n and remaining[nxt] <= 0:
+                nxt += 1
+            if nxt < n:
+                if hooks:
+                    instrument.idle_jumps += 1
+                time = arrival[nxt]
+                queue.append(nxt)
+                nxt += 1
+
+        if hooks:
+            instrument._dispatched(remaining[i] <= 0, len(queue), time)
+
+    state.time = time
+    state.nxt = nxt
+    state.cs = cs
+    state.last_pid = last_pid
+    state.completion_sum = completion_sum
+    if hooks:
+        instrument._end(state)
+
+def _append_merged(gantt, pid, start, end):
+    if gantt and gantt[-1][0] == pid and gantt[-1][2] == start:
+        gantt[-1] = (pid, gantt[-1][1], end)
+    else:
+        gantt.append((pid, start, end))
+
+def compute_extra_metrics(processes, completion, tat, wt, rt, gantt):
+    n = len(processes)
+    total_burst = sum(p[2] for p in processes)
+    total_time = gantt[-1][2] if gantt else 0
+    cpu_util = (total_burst / total_time * 100) if total_time > 0 else 0
+    throughput = (n / total_time) if total_time > 0 else 0
+    response_ratios = [(tat[i] / processes[i][2]) if processes[i][2] > 0 else float('inf') for i in range(n)]
+    avg_rr = fmean(response_ratios) if response_ratios else 0
+    return {
+        "total_time": total_time,
+        "total_burst": total_burst,
+        "cpu_util": cpu_util,
+        "throughput": throughput,
+        "response_ratios": response_ratios,
+        "avg_response_ratio": avg_rr
+    }
+
+def percentile(sorted_values, p):
+    # linear interpolation between closest ranks, like numpy's default
+    if not sorted_values:
+        return 0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+SWITCH_COST_KINDS = ("fixed", "uniform", "exponential")
+
+class _SwitchCostSampler:
+    # a class rather than a closure so it can be sent to sweep worker processes
+    def __init__(self, kind, mean, seed):
+        self.kind = kind
+        self.mean = mean
+        self.rng = random.Random(seed)
+
+    def __call__(self):
+        if self.kind == "uniform":
+            return self.rng.uniform(0, 2 * self.mean)
+        return self.rng.expovariate(1 / self.mean)
+
+def switch_cost_sampler(kind, mean, seed=None):
+    """Per-switch cost for round_robin(switch_cost=...).
+
+    kind is one of SWITCH_COST_KINDS: "fixed", "uniform" (0 to 2 * mean) or
+    "exponential". A fixed or zero cost is returned as a plain number.
+    """
+    if mean < 0:
+        raise ValueError("Switch cost must not be negative.")
+    if kind not in SWITCH_COST_KINDS:
+        raise ValueError(f"Unknown switch cost distribution {kind!r}.")
+    if kind == "fixed" or mean == 0:
+        return mean
+    return _SwitchCostSampler(kind, mean, seed)
@@ -0,0 +1,159 @@
+"""Level-of-detail Gantt rendering for matplotlib.
+
+One PolyCollection holds the bars and one LineCollection holds the
+context-switch lines, whatever the schedule size. Text labels are only
+drawn on bars that are wide enough on screen to fit them. Zoomed out
+past about one slice per pixel, neighbouring slices closer than a pixel
+are drawn as merged busy spans, and the switch lines collapse to at most
+one per pixel column. The view is rebuilt whenever the x-limits change,
+so zooming in with the toolbar brings back full detail for that range.
+
+matplotlib (and therefore numpy) is imported here, so the GUI imports
+this module lazily, together with pyplot.
+"""
+import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
+
+from rr_core import SWITCH
+
+COLORS = ["#FF6F61", "#6B5B95", "#88B04B", "#F7CAC9", "#92A8D1", "#955251", "#F4A460"]
+BUSY_COLOR = "#6B5B95"
+SWITCH_COLOR = "#B0B0B0"
+
+def _columns(gantt):
+    # (pid index array, start array, end array, pid names) from a Timeline
+    # or a list of (pid, start, end) tuples
+    if hasattr(gantt, "index") and hasattr(gantt, "pids"):
+        return (np.asarray(gantt.index), np.asarray(gantt.start, dtype=float),
+                np.asarray(gantt.end, dtype=float), list(gantt.pids))
+    names, lookup = [], {}
+    index = np.empty(len(gantt), dtype=np.int64)
+    start = np.empty(len(gantt), dtype=float)
+    end = np.empty(len(gantt), dtype=float)
+    for k, (pid, s, e) in enumerate(gantt):
+        idx = lookup.get(pid)
+        if idx is None:
+            idx = lookup[pid] = len(names)
+            names.append(pid)
+        index[k] = idx
+        start[k] = s
+        end[k] = e
+    return index, start, end, names
+
+def _bars(x0, x1, y, height):
+    # one rectangle per (x0[k], x1[k]) as an (n, 4, 2) vertex array
+    y0, y1 = y - height / 2, y + height / 2
+    verts = np.empty((len(x0), 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = x0
+    verts[:, 2, 0] = verts[:, 3, 0] = x1
+    verts[:, 0, 1] = verts[:, 3, 1] = y0
+    verts[:, 1, 1] = verts[:, 2, 1] = y1
+    return verts
+
+class GanttRenderer:
+    """Draws one Gantt lane on `ax` and keeps it in sync with zoom/pan.
+
+    Several renderers can share an axis by using different `y` values,
+    one lane each. The label and switch-line options match show_gantt().
+    """
+
+    def __init__(self, ax, gantt, y=0, height=0.8, show_cs_lines=True, label_min_px=28,
+                 max_labels=300, fontsize=9):
+        self.ax = ax
+        self.y = y
+        self.height = height
+        self.show_cs_lines = show_cs_lines
+        self.label_min_px = label_min_px
+        self.max_labels = max_labels
+        self.fontsize = fontsize
+        self.index, self.start, self.end, self.names = _columns(gantt)
+        # context-switch overhead segments are drawn grey and unlabelled
+        self.switch_index = self.names.index(SWITCH) if SWITCH in self.names else -1
+        self.switch_at = self._switch_times()
+        self._artists = []
+        self._bars = PolyCollection([], edgecolors="black", linewidths=0.5)
+        ax.add_collection(self._bars)
+        self._lines = LineCollection([], colors="red", linestyles="--", linewidths=1)
+        ax.add_collection(self._lines)
+        # a lambda, not the bound method: matplotlib only keeps weak references
+        # to bound methods, and nothing else holds on to the renderer
+        self._cid = ax.callbacks.connect("xlim_changed", lambda ax: self._on_xlim(ax))
+        if len(self.start):
+            ax.set_xlim(max(0, self.start[0] - 1), self.end[-1] + 1)
+        ax.set_ylim(min(ax.get_ylim()[0], y - 1), max(ax.get_ylim()[1], y + 1))
+        self.render()
+
+    def _switch_times(self):
+        # a switch is a change of process between consecutive real segments,
+        # drawn where its overhead segment starts if it has one
+        real = np.nonzero(self.index != self.switch_index)[0]
+        pos = real[1:][self.index[real[1:]] != self.index[real[:-1]]]
+        before = np.maximum(pos - 1, 0)
+        return np.where(self.index[before] == self.switch_index, self.start[before], self.start[pos])
+
+    def _on_xlim(self, ax):
+        self.render()
+        ax.figure.canvas.draw_idle()
+
+    def disconnect(self):
+        self.ax.callbacks.disconnect(self._cid)
+
+    def render(self):
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+        if not len(self.start):
+            self._bars.set_verts([])
+            self._lines.set_segments([])
+            return
+
+        x0, x1 = self.ax.get_xlim()
+        width_px = max(1.0, self.ax.bbox.width)
+        units_per_px = (x1 - x0) / width_px
+        lo = np.searchsorted(self.end, x0, side="left")
+        hi = np.searchsorted(self.start, x1, side="right")
+        start, end, index = self.start[lo:hi], self.end[lo:hi], self.index[lo:hi]
+
+        if len(start) <= width_px:
+            self._draw_detail(start, end, index, lo, units_per_px)
+        else:
+            self._draw_aggregate(start, end, units_per_px)
+        self._draw_switches(x0, x1, units_per_px)
+
+    def _draw_detail(self, start, end, index, offset, units_per_px):
+        colors = [COLORS[k % len(COLORS)] for k in range(offset, offset + len(start))]
+        for k in np.nonzero(index == self.switch_index)[0]:
+            colors[k] = SWITCH_COLOR
+        self._bars.set_verts(_bars(start, end, self.y, self.height))
+        self._bars.set_facecolors(colors)
+        wide = np.nonzero(((end - start) >= self.label_min_px * units_per_px)
+                          & (index != self.switch_index))[0][:self.max_labels]
+        for k in wide:
+            self._artists.append(self.ax.text((start[k] + end[k]) / 2, self.y, self.names[index[k]],
+                                              ha="center", va="center", color="white",
+                                              fontsize=self.fontsize, fontweight="bold", clip_on=True))
+
+    def _draw_aggregate(self, start, end, units_per_px):
+        # merge slices whose gap is under one pixel into busy spans
+        breaks = np.nonzero(start[1:] - end[:-1] > units_per_px)[0]
+        span_start = np.concatenate(([start[0]], start[breaks + 1]))
+        span_end = np.concatenate((end[breaks], [end[-1]]))
+        self._bars.set_verts(_bars(span_start, span_end, self.y, self.height))
+        self._bars.set_facecolors(BUSY_COLOR)
+
+    def _draw_switches(self, x0, x1, units_per_px):
+        if not self.show_cs_lines:
+            self._lines.set_segments([])
+            return
+        lo = np.searchsorted(self.switch_at, x0, side="left")
+        hi = np.searchsorted(self.switch_at, x1, side="right")
+        xs = self.switch_at[lo:hi]
+        if len(xs) > self.ax.bbox.width:
+            # at most one line per pixel column
+            xs = np.unique(np.floor((xs - x0) / units_per_px)) * units_per_px + x0
+        y0, y1 = self.y - self.height / 2 - 0.1, self.y + self.height / 2 + 0.1
+        segs = np.empty((len(xs), 2, 2))
+        segs[:, :, 0] = xs[:, None]
+        segs[:, 0, 1] = y0
+        segs[:, 1, 1] = y1
+        self._lines.set_segments(segs)
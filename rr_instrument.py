@@ -0,0 +1,263 @@
+"""Opt-in instrumentation and profiling for the Round Robin core.
+
+Pass an Instrument to round_robin(..., instrument=...) to count what the
+simulation loop does and, optionally, time each phase of it and report
+progress while it runs. rr_core._advance() calls the Instrument's hooks
+behind one flag, so a run without one pays a single test per dispatch.
+
+profile_run() and trace_memory() attach cProfile or tracemalloc to any
+call and can save what they collected.
+"""
+import cProfile
+import io
+import json
+import pstats
+import time as _time
+import tracemalloc
+from collections import deque
+
+PHASES = ("queue", "arrivals", "gantt", "other")
+
+class Instrument:
+    """Counters, phase timers and a progress callback for one simulation.
+
+    Counters are always collected. timers=True also times the queue
+    operations, arrival reads and Gantt appends by handing the loop
+    wrappers that read the clock around each call (this slows the run
+    down a lot). progress(completed, total,
+    sim_time) is called every `progress_every` dispatches and once at the
+    end; raising from it aborts the simulation. Every simulation starts
+    from zero, so a reused Instrument describes the latest run.
+    """
+
+    def __init__(self, timers=False, progress=None, progress_every=10000):
+        self.timers = timers
+        self.progress = progress
+        self.progress_every = max(1, progress_every)
+        self.reset()
+
+    def reset(self):
+        self.processes = 0
+        self.completed = 0
+        self.sim_time = 0
+        self.dispatches = 0
+        self.slices = 0
+        self.fast_path_skips = 0
+        self.arrivals_admitted = 0
+        self.idle_jumps = 0
+        self.context_switches = 0
+        # queue_hist[k] counts dispatches that found the ready queue at a length
+        # in [2**(k-1), 2**k) (k = 0: empty), so memory stays constant
+        self.queue_hist = []
+        self.max_queue = 0
+        self.phase_ns = dict.fromkeys(PHASES, 0)
+        self.wall_ns = 0
+
+    def queue_histogram(self):
+        # [(low, high, count)] with inclusive bounds
+        return [((1 << (k - 1)) if k else 0, (1 << k) - 1, c) for k, c in enumerate(self.queue_hist) if c]
+
+    def as_dict(self):
+        return {
+            "processes": self.processes,
+            "completed": self.completed,
+            "sim_time": self.sim_time,
+            "dispatches": self.dispatches,
+            "slices": self.slices,
+            "fast_path_skips": self.fast_path_skips,
+            "arrivals_admitted": self.arrivals_admitted,
+            "idle_jumps": self.idle_jumps,
+            "context_switches": self.context_switches,
+            "max_queue": self.max_queue,
+            "queue_histogram": [{"low": lo, "high": hi, "count": c} for lo, hi, c in self.queue_histogram()],
+            "wall_s": self.wall_ns / 1e9,
+            "phase_s": {k: v / 1e9 for k, v in self.phase_ns.items()} if self.timers else None,
+        }
+
+    def export(self, path):
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def report(self):
+        lines = [f"processes {self.completed}/{self.processes}, simulated time {self.sim_time}, "
+                 f"wall {self.wall_ns / 1e6:.1f} ms",
+                 f"dispatches {self.dispatches}, slices {self.slices} "
+                 f"({self.fast_path_skips} fast-path skips), context switches {self.context_switches}",
+                 f"arrivals admitted {self.arrivals_admitted}, idle jumps {self.idle_jumps}, "
+                 f"max queue {self.max_queue}"]
+        if self.timers and self.wall_ns:
+            lines.append("phases: " + ", ".join(f"{k} {v / 1e6:.1f} ms ({v / self.wall_ns:.0%})"
+                                                for k, v in self.phase_ns.items()))
+        lines.append("queue length at dispatch:")
+        for lo, hi, c in self.queue_histogram():
+            lines.append(f"  {lo:>8}-{hi:<8} {c}")
+        return "\n".join(lines)
+
+    def _count_queue(self, length):
+        k = length.bit_length()
+        hist = self.queue_hist
+        while len(hist) <= k:
+            hist.append(0)
+        hist[k] += 1
+        if length > self.max_queue:
+            self.max_queue = length
+
+    # hooks called by rr_core._advance()
+    def _begin(self, state, arrival, gantt):
+        # start a run; returns the arrival list and Gantt the loop should use
+        self.reset()
+        self.processes = len(arrival)
+        if state.queue:
+            self._count_queue(len(state.queue) - 1)
+        if self.timers:
+            state.queue = _TimedQueue(state.queue, self.phase_ns)
+            arrival = _TimedArrivals(arrival, self.phase_ns)
+            if gantt is not None:
+                gantt = _TimedGantt(gantt, self.phase_ns)
+        self._started = _time.perf_counter_ns()
+        return arrival, gantt
+
+    def _skipped(self, slices):
+        # the fast path ran `slices` whole slices in one step
+        self.fast_path_skips += 1
+        self.slices += slices
+
+    def _dispatched(self, completed, queued, sim_time):
+        # one dispatch is over; `queued` processes wait for the next one
+        self.dispatches += 1
+        self.slices += 1
+        if completed:
+            self.completed += 1
+        if queued:
+            self._count_queue(queued - 1)
+        if self.progress is not None and self.dispatches % self.progress_every == 0:
+            self.sim_time = sim_time
+            self.progress(self.completed, self.processes, sim_time)
+
+    def _end(self, state):
+        self.wall_ns += _time.perf_counter_ns() - self._started
+        if self.timers:
+            state.queue = deque(state.queue)
+            phase = self.phase_ns
+            phase["other"] = max(0, self.wall_ns - phase["queue"] - phase["arrivals"] - phase["gantt"])
+        # everything admitted has been dispatched by the time the queue drains
+        self.arrivals_admitted = sum(1 for r in state.first_response if r != -1)
+        self.sim_time = state.time
+        self.context_switches = state.cs
+        if self.progress is not None:
+            self.progress(self.completed, self.processes, state.time)
+
+class _TimedQueue(deque):
+    # the ready queue, charging pops and appends to the "queue" phase
+    def __init__(self, items, phase_ns):
+        super().__init__(items)
+        self.phase_ns = phase_ns
+
+    def popleft(self):
+        t0 = _time.perf_counter_ns()
+        i = super().popleft()
+        self.phase_ns["queue"] += _time.perf_counter_ns() - t0
+        return i
+
+    def append(self, i):
+        t0 = _time.perf_counter_ns()
+        super().append(i)
+        self.phase_ns["queue"] += _time.perf_counter_ns() - t0
+
+class _TimedArrivals:
+    # the arrival times, charging every read to the "arrivals" phase (the
+    # scan for new arrivals after each slice does nearly all of them)
+    def __init__(self, arrival, phase_ns):
+        self.arrival = arrival
+        self.phase_ns = phase_ns
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def __getitem__(self, k):
+        t0 = _time.perf_counter_ns()
+        at = self.arrival[k]
+        self.phase_ns["arrivals"] += _time.perf_counter_ns() - t0
+        return at
+
+class _TimedGantt:
+    # the Gantt chart (a list or Timeline), charging every access to the
+    # "gantt" phase
+    def __init__(self, gantt, phase_ns):
+        self.gantt = gantt
+        self.phase_ns = phase_ns
+
+    def __bool__(self):
+        return bool(self.gantt)
+
+    def __getitem__(self, k):
+        t0 = _time.perf_counter_ns()
+        segment = self.gantt[k]
+        self.phase_ns["gantt"] += _time.perf_counter_ns() - t0
+        return segment
+
+    def __setitem__(self, k, segment):
+        t0 = _time.perf_counter_ns()
+        self.gantt[k] = segment
+        self.phase_ns["gantt"] += _time.perf_counter_ns() - t0
+
+    def append(self, segment):
+        t0 = _time.perf_counter_ns()
+        self.gantt.append(segment)
+        self.phase_ns["gantt"] += _time.perf_counter_ns() - t0
+
+    def extend(self, segments):
+        t0 = _time.perf_counter_ns()
+        self.gantt.extend(segments)
+        self.phase_ns["gantt"] += _time.perf_counter_ns() - t0
+
+# ---------------------
+# Profilers
+# ---------------------
+def profile_run(fn, *args, path=None, sort="cumulative", **kwargs):
+    """Run fn(*args, **kwargs) under cProfile; returns (result, pstats.Stats).
+
+    path, if given, receives the raw profile (for snakeviz, pstats, ...).
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+    if path:
+        profiler.dump_stats(path)
+    stats = pstats.Stats(profiler, stream=io.StringIO()).sort_stats(sort)
+    return result, stats
+
+def profile_report(stats, limit=20):
+    # text of the top `limit` entries of a pstats.Stats
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.print_stats(limit)
+    return stream.getvalue()
+
+def trace_memory(fn, *args, top=10, path=None, **kwargs):
+    """Run fn(*args, **kwargs) under tracemalloc; returns (result, summary).
+
+    summary holds the peak and final traced sizes in bytes and the `top`
+    allocation sites still alive at the end. path, if given, receives the
+    summary as JSON.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        result = fn(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    summary = {
+        "peak_bytes": peak,
+        "current_bytes": current,
+        "top": [{"site": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                for stat in snapshot.statistics("lineno")[:top]],
+    }
+    if path:
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+    return result, summary
@@ -0,0 +1,283 @@
+"""Pluggable scheduling policies on one event-driven simulation core.
+
+simulate() owns the clock, the arrival cursor, the Gantt and the metrics.
+A policy only decides which ready process runs next and for how long. It
+returns the same tuple as round_robin(), so compute_extra_metrics(),
+show_gantt() and display_results_in_tree() work with any policy.
+
+Processes are (pid, arrival, burst) or (pid, arrival, burst, priority),
+where a lower priority number runs first.
+"""
+import heapq
+from collections import deque
+
+from rr_core import SWITCH, _append_merged, percentile
+
+class Policy:
+    name = "policy"
+    preemptive = False  # True: the running process is re-evaluated at every arrival
+
+    def reset(self, processes):
+        self.processes = processes
+
+    def push(self, i, remaining):
+        # process i has arrived
+        raise NotImplementedError
+
+    def requeue(self, i, remaining, ran):
+        # process i ran for `ran` units and still has `remaining` left
+        self.push(i, remaining)
+
+    def pop(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def slice(self, i, remaining):
+        # how long process i may run (simulate() still stops at the next
+        # arrival when the policy is preemptive)
+        return remaining
+
+class FCFS(Policy):
+    name = "FCFS"
+
+    def reset(self, processes):
+        super().reset(processes)
+        self.queue = deque()
+
+    def push(self, i, remaining):
+        self.queue.append(i)
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def __len__(self):
+        return len(self.queue)
+
+class RoundRobin(FCFS):
+    name = "RR"
+
+    def __init__(self, quantum):
+        if quantum <= 0:
+            raise ValueError("Time quantum must be positive.")
+        self.quantum = quantum
+
+    def slice(self, i, remaining):
+        return min(remaining, self.quantum)
+
+class _HeapPolicy(Policy):
+    # ready processes ordered by key(i, remaining); ties go to the earlier arrival
+
+    def reset(self, processes):
+        super().reset(processes)
+        self.heap = []
+
+    def key(self, i, remaining):
+        raise NotImplementedError
+
+    def push(self, i, remaining):
+        heapq.heappush(self.heap, (self.key(i, remaining), i))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[1]
+
+    def __len__(self):
+        return len(self.heap)
+
+class SJF(_HeapPolicy):
+    name = "SJF"
+
+    def key(self, i, remaining):
+        return self.processes[i][2]
+
+class SRTF(_HeapPolicy):
+    name = "SRTF"
+    preemptive = True
+
+    def key(self, i, remaining):
+        return remaining
+
+class Priority(_HeapPolicy):
+    name = "Priority"
+
+    def __init__(self, preemptive=False):
+        self.preemptive = preemptive
+        if preemptive:
+            self.name = "Priority (preemptive)"
+
+    def key(self, i, remaining):
+        proc = self.processes[i]
+        return proc[3] if len(proc) > 3 else 0
+
+class MLFQ(Policy):
+    """Multi-level feedback queue: one FIFO per level.
+
+    New arrivals enter level 0. A process that uses its whole quantum
+    drops a level, and the last level is round robin with the last
+    quantum. A slice that has started is never cut short.
+    """
+    name = "MLFQ"
+
+    def __init__(self, quanta=(4, 8, 16)):
+        if not quanta or any(q <= 0 for q in quanta):
+            raise ValueError("MLFQ quanta must be positive.")
+        self.quanta = tuple(quanta)
+
+    def reset(self, processes):
+        super().reset(processes)
+        self.levels = [deque() for _ in self.quanta]
+        self.level_of = [0] * len(processes)
+        self.count = 0
+
+    def push(self, i, remaining):
+        self.levels[self.level_of[i]].append(i)
+        self.count += 1
+
+    def requeue(self, i, remaining, ran):
+        level = self.level_of[i]
+        if ran >= self.quanta[level] and level + 1 < len(self.quanta):
+            self.level_of[i] = level + 1
+        self.push(i, remaining)
+
+    def pop(self):
+        for level in self.levels:
+            if level:
+                self.count -= 1
+                return level.popleft()
+        raise IndexError("pop from an empty MLFQ")
+
+    def __len__(self):
+        return self.count
+
+    def slice(self, i, remaining):
+        return min(remaining, self.quanta[self.level_of[i]])
+
+def simulate(processes, policy, compress=False, switch_cost=0, progress=None, progress_every=10000):
+    # switch_cost works as in round_robin(): a number or a per-switch callable.
+    # progress(completed, total, sim_time) is called every progress_every
+    # dispatches and at the end, like rr_instrument.Instrument's callback;
+    # raising from it aborts the run.
+    processes = sorted(processes, key=lambda x: x[1])
+    n = len(processes)
+    pids = [p[0] for p in processes]
+    arrival = [p[1] for p in processes]
+    remaining = [p[2] for p in processes]
+    completion = [0] * n
+    first_response = [-1] * n
+    gantt = []
+    cs = 0
+    last_pid = None
+    policy.reset(processes)
+    preemptive = policy.preemptive
+    sample_cost = switch_cost if callable(switch_cost) else None
+    dispatches = 0
+    completed = 0
+
+    time = 0
+    nxt = 0
+    while nxt < n or len(policy):
+        if not len(policy):
+            # idle CPU: jump to the next arrival
+            time = max(time, arrival[nxt])
+        while nxt < n and arrival[nxt] <= time:
+            if remaining[nxt] > 0:
+                policy.push(nxt, remaining[nxt])
+            nxt += 1
+        if not len(policy):
+            continue
+
+        i = policy.pop()
+        pid = pids[i]
+        if last_pid is not None and pid != last_pid:
+            cs += 1
+            if switch_cost:
+                cost = sample_cost() if sample_cost else switch_cost
+                if cost > 0:
+                    gantt.append((SWITCH, time, time + cost))
+                    time += cost
+                    # arrivals during the switch wait for the next decision;
+                    # the preemption cut-off below is the first one after it
+                    while nxt < n and arrival[nxt] <= time:
+                        if remaining[nxt] > 0:
+                            policy.push(nxt, remaining[nxt])
+                        nxt += 1
+        last_pid = pid
+        if first_response[i] == -1:
+            first_response[i] = time - arrival[i]
+
+        run_time = policy.slice(i, remaining[i])
+        if preemptive and nxt < n and arrival[nxt] - time < run_time:
+            run_time = arrival[nxt] - time
+        end = time + run_time
+        if compress:
+            _append_merged(gantt, pid, time, end)
+        else:
+            gantt.append((pid, time, end))
+        time = end
+        remaining[i] -= run_time
+
+        # arrivals during the slice queue up ahead of the process it preempted
+        while nxt < n and arrival[nxt] <= time:
+            if remaining[nxt] > 0:
+                policy.push(nxt, remaining[nxt])
+            nxt += 1
+        if remaining[i] > 0:
+            policy.requeue(i, remaining[i], run_time)
+        else:
+            completion[i] = time
+            completed += 1
+
+        if progress is not None:
+            dispatches += 1
+            if dispatches % progress_every == 0:
+                progress(completed, n, time)
+
+    if progress is not None:
+        progress(completed, n, time)
+    tat = [completion[i] - arrival[i] for i in range(n)]
+    wt = [tat[i] - processes[i][2] for i in range(n)]
+    rt = first_response
+    return processes, completion, tat, wt, rt, gantt, cs
+
+POLICY_NAMES = ("RR", "FCFS", "SJF", "SRTF", "Priority", "MLFQ")
+
+def make_policy(name, quantum=None):
+    if name == "RR":
+        return RoundRobin(quantum)
+    if name == "FCFS":
+        return FCFS()
+    if name == "SJF":
+        return SJF()
+    if name == "SRTF":
+        return SRTF()
+    if name == "Priority":
+        return Priority()
+    if name == "MLFQ":
+        # levels at 1x, 2x and 4x the base quantum
+        return MLFQ((quantum, 2 * quantum, 4 * quantum)) if quantum else MLFQ()
+    raise ValueError(f"Unknown scheduling policy {name!r}; choose one of {', '.join(POLICY_NAMES)}.")
+
+def policy_metrics(result):
+    procs, completion, tat, wt, rt, gantt, cs = result
+    n = len(procs)
+    total_time = gantt[-1][2] if gantt else 0
+    wt_sorted, rt_sorted = sorted(wt), sorted(rt)
+    return {
+        "processes": n,
+        "total_time": total_time,
+        "throughput": (n / total_time) if total_time > 0 else 0,
+        "avg_tat": sum(tat) / n if n else 0,
+        "avg_wt": sum(wt) / n if n else 0,
+        "avg_rt": sum(rt) / n if n else 0,
+        "p95_wt": percentile(wt_sorted, 95),
+        "p99_wt": percentile(wt_sorted, 99),
+        "p95_rt": percentile(rt_sorted, 95),
+        "p99_rt": percentile(rt_sorted, 99),
+        "cs": cs,
+    }
+
+def compare_policies(processes, policies, switch_cost=0):
+    """Run every policy on the same trace; returns {policy name: metrics}."""
+    return {policy.name: policy_metrics(simulate(processes, policy, compress=True, switch_cost=switch_cost))
+            for policy in policies}
@@ -0,0 +1,177 @@
+"""Multi-CPU (SMP) Round Robin simulation.
+
+Each CPU time-slices its own processes. Slices are not synchronized
+across CPUs: an event heap of slice ends drives the clock. Two queueing
+modes are available:
+
+* "global"  - one shared ready queue; an idle CPU takes the head.
+* "per-cpu" - one ready queue per CPU. Arrivals go to the least loaded
+  CPU, a preempted process goes back to the queue of the CPU it ran on,
+  and an idle CPU with an empty queue steals from the tail of the longest
+  other queue.
+
+A migration is a dispatch on a different CPU from the one the process
+last ran on. Context switches are counted per CPU, the same way
+round_robin() counts them for one CPU.
+"""
+import heapq
+from collections import deque
+
+from rr_core import SWITCH, compute_extra_metrics
+
+SMP_MODES = ("global", "per-cpu")
+
+def round_robin_smp(processes, quantum, cpus=2, mode="global", switch_cost=0, progress=None,
+                    progress_every=10000):
+    """Simulate RR on `cpus` CPUs.
+
+    Returns (processes, completion, tat, wt, rt, lanes, stats). lanes
+    holds one Gantt list per CPU. stats is a dict with cs per CPU and in
+    total, migrations, steals, busy time, per-CPU utilization (%),
+    total_time and throughput. switch_cost is charged on each CPU as in
+    round_robin(). With cpus=1 the schedule is the same as round_robin()'s.
+    progress(completed, total, sim_time), if given, is called every
+    progress_every dispatches and at the end; raising from it aborts the run.
+    """
+    if quantum <= 0:
+        raise ValueError("Time quantum must be positive.")
+    if cpus < 1:
+        raise ValueError("Number of CPUs must be at least 1.")
+    if mode not in SMP_MODES:
+        raise ValueError(f"SMP mode must be one of {', '.join(SMP_MODES)}.")
+
+    processes = sorted(processes, key=lambda x: x[1])
+    n = len(processes)
+    pids = [p[0] for p in processes]
+    arrival = [p[1] for p in processes]
+    remaining = [p[2] for p in processes]
+    completion = [0] * n
+    first_response = [-1] * n
+    last_cpu = [-1] * n
+
+    shared = mode == "global"
+    queues = [deque()] if shared else [deque() for _ in range(cpus)]
+    running = [None] * cpus
+    lanes = [[] for _ in range(cpus)]
+    cs = [0] * cpus
+    busy = [0] * cpus
+    last_pid = [None] * cpus
+    migrations = 0
+    steals = 0
+    events = []  # (slice end, cpu)
+    sample_cost = switch_cost if callable(switch_cost) else None
+    dispatches = 0
+    completed = 0
+
+    def admit(i):
+        if shared:
+            queues[0].append(i)
+        else:
+            target = min(range(cpus), key=lambda c: len(queues[c]) + (running[c] is not None))
+            queues[target].append(i)
+
+    def take(c):
+        nonlocal steals
+        local = queues[0] if shared else queues[c]
+        if local:
+            return local.popleft()
+        if shared:
+            return None
+        victim = max(range(cpus), key=lambda k: len(queues[k]))
+        if queues[victim]:
+            steals += 1
+            return queues[victim].pop()
+        return None
+
+    now = 0
+    nxt = 0
+    while nxt < n or events or any(queues):
+        t = events[0][0] if events else None
+        if nxt < n and (t is None or arrival[nxt] < t):
+            t = arrival[nxt]
+        if t is not None:
+            now = max(now, t)
+
+        preempted = []
+        ended = []
+        while events and events[0][0] <= now:
+            ended.append(heapq.heappop(events)[1])
+        for c in sorted(ended):
+            i = running[c]
+            running[c] = None
+            if remaining[i] > 0:
+                preempted.append((c, i))
+            else:
+                completion[i] = now
+                completed += 1
+
+        # as in round_robin(), arrivals queue up ahead of preempted processes
+        while nxt < n and arrival[nxt] <= now:
+            if remaining[nxt] > 0:
+                admit(nxt)
+            nxt += 1
+        for c, i in preempted:
+            queues[0 if shared else c].append(i)
+
+        for c in range(cpus):
+            if running[c] is not None:
+                continue
+            i = take(c)
+            if i is None:
+                continue
+            if last_cpu[i] not in (-1, c):
+                migrations += 1
+            last_cpu[i] = c
+            start = now
+            pid = pids[i]
+            if last_pid[c] is not None and pid != last_pid[c]:
+                cs[c] += 1
+                if switch_cost:
+                    cost = sample_cost() if sample_cost else switch_cost
+                    if cost > 0:
+                        lanes[c].append((SWITCH, start, start + cost))
+                    start += cost
+            last_pid[c] = pid
+            if first_response[i] == -1:
+                first_response[i] = start - arrival[i]
+
+            run_time = min(remaining[i], quantum)
+            lanes[c].append((pid, start, start + run_time))
+            busy[c] += run_time
+            remaining[i] -= run_time
+            running[c] = i
+            heapq.heappush(events, (start + run_time, c))
+            if progress is not None:
+                dispatches += 1
+                if dispatches % progress_every == 0:
+                    progress(completed, n, now)
+
+    if progress is not None:
+        progress(completed, n, now)
+
+    tat = [completion[i] - arrival[i] for i in range(n)]
+    wt = [tat[i] - processes[i][2] for i in range(n)]
+    rt = first_response
+
+    total_time = max((lane[-1][2] for lane in lanes if lane), default=0)
+    stats = {
+        "cpus": cpus,
+        "mode": mode,
+        "cs_per_cpu": cs,
+        "cs": sum(cs),
+        "migrations": migrations,
+        "steals": steals,
+        "busy": busy,
+        "utilization": [(b / total_time * 100) if total_time > 0 else 0 for b in busy],
+        "total_time": total_time,
+        "throughput": (n / total_time) if total_time > 0 else 0,
+    }
+    return processes, completion, tat, wt, rt, lanes, stats
+
+def smp_extra_metrics(processes, completion, tat, wt, rt, lanes):
+    # compute_extra_metrics() for a multi-CPU run: the schedule ends with the
+    # last lane to finish, and utilization is averaged over the CPUs
+    end = max((lane[-1][2] for lane in lanes if lane), default=0)
+    extras = compute_extra_metrics(processes, completion, tat, wt, rt, [(None, 0, end)] if end else [])
+    extras["cpu_util"] /= len(lanes)
+    return extras
@@ -0,0 +1,440 @@
+"""Streaming Round Robin: process records in, completion records out.
+
+OnlineScheduler accepts arrivals one at a time, from a live feed or an
+iterator, and advances simulated time as far as the arrivals it has seen
+allow. It yields Gantt segments and completion records as it goes. Only
+processes that have arrived and not yet finished are held in memory, and
+StreamSummary keeps the running metrics, tail latencies included, in space
+that does not grow with the trace. The schedule is the same as
+round_robin()'s.
+
+iter_round_robin() is the batch form: a sorted trace in, one completion
+record per process out. It has its own loop without the bookkeeping for
+live arrivals and Gantt events, which makes it about twice as fast as
+feeding the trace through an OnlineScheduler.
+
+Percentiles are linear interpolations between the closest ranks, the
+same definition that rr_core.percentile() and numpy use.
+"""
+import math
+from collections import deque
+from itertools import chain
+
+from rr_core import SWITCH
+
+RECORD_FIELDS = ("pid", "arrival", "burst", "completion", "tat", "wt", "rt")
+
+class LogHistogram:
+    """Percentiles of a non-negative stream in bounded memory.
+
+    Values fall into geometric buckets [g**(k-1), g**k) with
+    g = (1 + accuracy) / (1 - accuracy), as in DDSketch, so a percentile
+    read back is within `accuracy` (relative) of a sample at that rank.
+    The bucket count grows with the log of the value range, not with the
+    number of samples: a few thousand buckets cover 1e-6 to 1e12.
+    """
+    __slots__ = ("gamma", "_log_gamma", "buckets", "zeros", "count", "max")
+
+    def __init__(self, accuracy=0.01):
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.max = 0
+
+    def add(self, x):
+        self.count += 1
+        if x <= 0:
+            self.zeros += 1
+            return
+        if x > self.max:
+            self.max = x
+        k = math.ceil(math.log(x) / self._log_gamma)
+        buckets = self.buckets
+        buckets[k] = buckets.get(k, 0) + 1
+
+    def percentile(self, p):
+        # linear interpolation between the closest ranks, as rr_core.percentile()
+        if not self.count:
+            return 0
+        rank = p / 100 * (self.count - 1)
+        lo = int(rank)
+        hi = min(lo + 1, self.count - 1)
+        lo_value = self._value_at(lo)
+        if hi == lo:
+            return lo_value
+        return lo_value + (self._value_at(hi) - lo_value) * (rank - lo)
+
+    def _value_at(self, i):
+        # estimate of the i-th smallest sample (0-based)
+        if i < self.zeros:
+            return 0
+        if i >= self.count - 1:
+            return self.max
+        seen = self.zeros
+        for k in sorted(self.buckets):
+            seen += self.buckets[k]
+            if i < seen:
+                # bucket midpoint in relative terms, never above the largest sample
+                return min(self.max, 2 * self.gamma ** k / (self.gamma + 1))
+        return self.max
+
+class StreamSummary:
+    # running aggregates, updated as completion records are produced
+    __slots__ = ("processes", "total_burst", "tat_sum", "wt_sum", "rt_sum", "max_wt", "total_time", "cs",
+                 "wt_hist", "rt_hist")
+
+    TAIL_PERCENTILES = (95, 99)  # reported by as_dict()
+
+    def __init__(self):
+        self.processes = 0
+        self.total_burst = 0
+        self.tat_sum = 0
+        self.wt_sum = 0
+        self.rt_sum = 0
+        self.max_wt = 0
+        self.total_time = 0
+        self.cs = 0
+        # tail latencies; any percentile can be read with .percentile(p)
+        self.wt_hist = LogHistogram()
+        self.rt_hist = LogHistogram()
+
+    def add(self, record):
+        _, _, bt, _, tat, wt, rt = record
+        self.processes += 1
+        self.total_burst += bt
+        self.tat_sum += tat
+        self.wt_sum += wt
+        self.rt_sum += rt
+        if wt > self.max_wt:
+            self.max_wt = wt
+        self.wt_hist.add(wt)
+        self.rt_hist.add(rt)
+
+    def as_dict(self):
+        n = self.processes
+        total_time = self.total_time
+        summary = {
+            "processes": n,
+            "total_time": total_time,
+            "total_burst": self.total_burst,
+            "cpu_util": (self.total_burst / total_time * 100) if total_time > 0 else 0,
+            "throughput": (n / total_time) if total_time > 0 else 0,
+            "avg_tat": self.tat_sum / n if n else 0,
+            "avg_wt": self.wt_sum / n if n else 0,
+            "avg_rt": self.rt_sum / n if n else 0,
+            "max_wt": self.max_wt,
+            "cs": self.cs,
+        }
+        for p in self.TAIL_PERCENTILES:
+            summary[f"p{p}_wt"] = self.wt_hist.percentile(p)
+            summary[f"p{p}_rt"] = self.rt_hist.percentile(p)
+        return summary
+
+class OnlineScheduler:
+    """Round Robin over arrivals that are submitted as they happen.
+
+        sched = OnlineScheduler(4)
+        sched.submit("P1", 0, 10)
+        for kind, value in sched.run(until=3):   # every arrival before t=3 is in
+            ...                                  # ("slice", (pid, start, end)) or ("done", record)
+        sched.close()                            # no more arrivals
+        for kind, value in sched.run():          # run to the end
+            ...
+
+    Arrivals must be submitted in arrival order. A slice is only simulated
+    once every arrival up to its end is known: that is, up to the latest
+    submitted arrival, the `until` of run() (a promise that nothing earlier
+    is still to come), or without limit after close(). switch_cost is
+    charged as in round_robin(). gantt=False skips the "slice" events.
+    """
+
+    def __init__(self, quantum, switch_cost=0, gantt=True, summary=None):
+        if quantum <= 0:
+            raise ValueError("Time quantum must be positive.")
+        self.quantum = quantum
+        self.switch_cost = switch_cost
+        self.gantt = gantt
+        self.summary = summary if summary is not None else StreamSummary()
+        self.time = 0
+        self.cs = 0
+        self.closed = False
+        # live process: [pid, arrival, burst, remaining, first_response]
+        self._ready = deque()
+        self._upcoming = deque()  # submitted, arrival still ahead of the clock
+        self._last_pid = None
+        self._last_arrival = None
+        self._horizon = None  # every arrival before this time has been submitted
+        self._cost = None     # switch cost already drawn for a dispatch that had to wait
+
+    @property
+    def ready(self):
+        return len(self._ready)
+
+    @property
+    def pending(self):
+        return len(self._upcoming)
+
+    @property
+    def finished(self):
+        return self.closed and not self._ready and not self._upcoming
+
+    def snapshot(self):
+        # running metrics plus the live state, for dashboards
+        state = self.summary.as_dict()
+        state.update(time=self.time, ready=len(self._ready), pending=len(self._upcoming), cs=self.cs)
+        return state
+
+    def submit(self, pid, arrival, burst):
+        if self.closed:
+            raise ValueError("cannot submit to a closed scheduler")
+        if self._last_arrival is not None and arrival < self._last_arrival:
+            raise ValueError(f"trace is not sorted by arrival time at process {pid}")
+        if self._horizon is not None and arrival < self._horizon:
+            raise ValueError(f"process {pid} arrives at {arrival}, before the time already simulated")
+        if burst <= 0:
+            raise ValueError(f"burst time must be positive for process {pid}")
+        self._last_arrival = arrival
+        self._horizon = arrival
+        self._upcoming.append([pid, arrival, burst, burst, -1])
+
+    def close(self):
+        self.closed = True
+
+    def run(self, until=None):
+        """Simulate as far as the known arrivals allow; yield events.
+
+        Events are ("slice", (pid, start, end)), with pid SWITCH for
+        context-switch overhead, and ("done", completion record).
+        """
+        bound = self._bound(until)
+        if bound is None and not self.closed:
+            return
+        while True:
+            events = self._dispatch(bound)
+            if events is None:
+                return
+            yield from events
+
+    def step(self, until=None):
+        # one dispatch; its events as a list (empty when waiting for arrivals)
+        bound = self._bound(until)
+        if bound is None and not self.closed:
+            return []
+        return list(self._dispatch(bound) or ())
+
+    def segments(self, until=None):
+        for kind, value in self.run(until):
+            if kind == "slice":
+                yield value
+
+    def completions(self, until=None):
+        for kind, value in self.run(until):
+            if kind == "done":
+                yield value
+
+    def feed(self, records, until_end=True):
+        """Submit (pid, arrival, burst) records from an iterator lazily.
+
+        Each record is read only once the simulation has caught up with
+        its arrival time. With until_end the scheduler is closed and run to
+        completion when the records run out.
+        """
+        dispatch = self._dispatch
+        for pid, at, bt in records:
+            # everything before `at` is known now
+            if self._horizon is None or at > self._horizon:
+                self._horizon = at
+            events = dispatch(at)
+            while events is not None:
+                yield from events
+                events = dispatch(at)
+            self.submit(pid, at, bt)
+        if until_end:
+            self.close()
+            yield from self.run()
+
+    def _bound(self, until):
+        # how far the clock may run; `until` also promises that every
+        # arrival before it has been submitted
+        if until is not None and not self.closed and (self._horizon is None or until > self._horizon):
+            self._horizon = until
+        return until if until is not None else (None if self.closed else self._horizon)
+
+    def _dispatch(self, bound):
+        # run the next slice if everything that can affect it is known and
+        # return its events; None when nothing can happen until more
+        # arrivals are submitted
+        ready, upcoming, q = self._ready, self._upcoming, self.quantum
+        time = self.time
+        if not ready:
+            if not upcoming:
+                return None
+            at = upcoming[0][1]
+            if bound is not None and at >= bound:
+                return None
+            if at > time:
+                time = self.time = at  # idle CPU: jump to the next arrival
+            while upcoming and upcoming[0][1] <= time:
+                ready.append(upcoming.popleft())
+
+        proc = ready[0]
+        pid = proc[0]
+        switching = self._last_pid is not None and pid != self._last_pid
+        cost = 0
+        if switching and self.switch_cost:
+            if self._cost is None:
+                self._cost = self.switch_cost() if callable(self.switch_cost) else self.switch_cost
+            cost = self._cost
+        start = time + cost
+        remaining = proc[3]
+        if bound is not None and start + (remaining if remaining < q else q) >= bound:
+            return None
+
+        ready.popleft()
+        gantt = self.gantt
+        events = []
+        if switching:
+            self._cost = None
+            self.cs += 1
+            if cost > 0 and gantt:
+                events.append(("slice", (SWITCH, time, start)))
+        self._last_pid = pid
+        if proc[4] == -1:
+            proc[4] = start - proc[1]
+        time = start
+
+        skipped = None
+        n_head = len(events)
+        if not ready and remaining > q:
+            # alone on the CPU: skip to its last uninterrupted full slice
+            # before the next arrival, known or not yet submitted
+            skip = int(-(-remaining // q)) - 1
+            if upcoming:
+                skip = min(skip, int(-((time - upcoming[0][1]) // q)) - 1)
+            if bound is not None:
+                skip = min(skip, int(-((time - bound) // q)) - 1)
+            if skip > 0:
+                if gantt:
+                    skipped = _full_slices(pid, time, q, skip)
+                time += skip * q
+                remaining -= skip * q
+                if bound is not None and time + (remaining if remaining < q else q) >= bound:
+                    # the last slice has to wait for later arrivals
+                    proc[3] = remaining
+                    ready.appendleft(proc)
+                    self.time = time
+                    return chain(events, skipped) if skipped else events
+
+        run_time = remaining if remaining < q else q
+        end = time + run_time
+        if gantt:
+            events.append(("slice", (pid, time, end)))
+        proc[3] = remaining = remaining - run_time
+        self.time = end
+
+        # arrivals during the slice queue up ahead of the process it preempted
+        while upcoming and upcoming[0][1] <= end:
+            ready.append(upcoming.popleft())
+        if remaining > 0:
+            ready.append(proc)
+        else:
+            pid, at, bt, _, rt = proc
+            tat = end - at
+            record = (pid, at, bt, end, tat, tat - bt, rt)
+            summary = self.summary
+            summary.add(record)
+            summary.total_time = end
+            summary.cs = self.cs
+            events.append(("done", record))
+        if skipped:
+            return chain(events[:n_head], skipped, events[n_head:])
+        return events
+
+def _full_slices(pid, start, quantum, count):
+    for k in range(count):
+        yield ("slice", (pid, start + k * quantum, start + (k + 1) * quantum))
+
+def iter_round_robin(records, quantum, summary=None):
+    """Yield (pid, arrival, burst, completion, tat, wt, rt) in completion order.
+
+    records must be sorted by arrival (ValueError otherwise) and every
+    burst must be positive. Pass a StreamSummary to collect aggregate
+    metrics while the generator runs.
+    """
+    if quantum <= 0:
+        raise ValueError("Time quantum must be positive.")
+    records = iter(records)
+    # live process: [pid, arrival, burst, remaining, first_response]
+    queue = deque()
+    time = 0
+    last_pid = None
+    last_arrival = None
+    cs = 0
+
+    def take():
+        nonlocal last_arrival
+        rec = next(records, None)
+        if rec is None:
+            return None
+        pid, at, bt = rec
+        if last_arrival is not None and at < last_arrival:
+            raise ValueError(f"trace is not sorted by arrival time at process {pid}")
+        if bt <= 0:
+            raise ValueError(f"burst time must be positive for process {pid}")
+        last_arrival = at
+        return [pid, at, bt, bt, -1]
+
+    upcoming = take()
+    if upcoming is not None and upcoming[1] > 0:
+        time = upcoming[1]
+    while upcoming is not None and upcoming[1] <= time:
+        queue.append(upcoming)
+        upcoming = take()
+
+    while queue:
+        proc = queue.popleft()
+        if proc[4] == -1:
+            proc[4] = time - proc[1]
+
+        pid = proc[0]
+        if last_pid is not None and pid != last_pid:
+            cs += 1
+        last_pid = pid
+
+        if not queue and proc[3] > quantum:
+            # alone on the CPU: skip to its last uninterrupted full slice
+            skip = int(-(-proc[3] // quantum)) - 1
+            if upcoming is not None:
+                skip = min(skip, int(-((time - upcoming[1]) // quantum)) - 1)
+            if skip > 0:
+                time += skip * quantum
+                proc[3] -= skip * quantum
+
+        run_time = min(proc[3], quantum)
+        time += run_time
+        proc[3] -= run_time
+
+        while upcoming is not None and upcoming[1] <= time:
+            queue.append(upcoming)
+            upcoming = take()
+
+        if proc[3] > 0:
+            queue.append(proc)
+        else:
+            pid, at, bt, _, rt = proc
+            tat = time - at
+            record = (pid, at, bt, time, tat, tat - bt, rt)
+            if summary is not None:
+                summary.add(record)
+                summary.total_time = time
+                summary.cs = cs
+            yield record
+
+        if not queue and upcoming is not None:
+            time = upcoming[1]
+            queue.append(upcoming)
+            upcoming = take()
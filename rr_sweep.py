@@ -0,0 +1,289 @@
+"""Quantum sweeps for "Analyze Quantum Effect", run on a process pool.
+
+Headless like rr_core: no tkinter or matplotlib imports here. Workers are
+started with the "spawn" method, so each one also re-imports the
+program's __main__ module. Under the GUI (python Round_Robin.py), that
+means tkinter and the other rr_* modules load in every worker, but the
+__main__ guard stops them from opening a window, and matplotlib is never
+imported.
+"""
+import copy
+import multiprocessing
+import os
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import mean
+
+from rr_cache import cache_key, workload_key
+from rr_core import _RRState, _advance, round_robin
+
+def quantum_point(processes, quantum, switch_cost=0):
+    # (quantum, avg_wt, avg_tat, cs, throughput); with a switch cost the
+    # throughput is what remains after switching overhead
+    _, _, tat, wt, _, gantt, cs = round_robin(processes, quantum, compress=True, switch_cost=switch_cost)
+    total_time = gantt[-1][2] if gantt else 0
+    throughput = (len(tat) / total_time) if total_time > 0 else 0
+    return quantum, (mean(wt) if wt else 0), (mean(tat) if tat else 0), cs, throughput
+
+def best_throughput(points):
+    # the sweep point with the highest throughput (smallest quantum on ties)
+    return max(points, key=lambda p: (p[4], -p[0])) if points else None
+
+def _busy_periods(arrival, burst):
+    # [(start, stop)] index ranges of the busy periods. RR never idles with
+    # work queued, so without switching overhead the CPU is busy over exactly
+    # these intervals whatever the quantum
+    periods = []
+    start, end = 0, None
+    for i, at in enumerate(arrival):
+        if end is not None and at > end:
+            periods.append((start, i))
+            start, end = i, None
+        end = (at if end is None else end) + burst[i]
+    if arrival:
+        periods.append((start, len(arrival)))
+    return periods
+
+def _sweep_period(pids, arrival, burst, quanta, switch_cost=0):
+    # [(lo, hi, completion_sum, cs, last_pid, time)]: one part per range
+    # quanta[lo:hi] that follows a single schedule through this stretch
+    parts = []
+    if callable(switch_cost):
+        # a sampled cost is one random stream per run: each quantum draws from
+        # its own copy of the sampler, as it would when run alone
+        for k, q in enumerate(quanta):
+            state = _RRState(arrival, list(burst))
+            _advance(state, pids, arrival, q, switch_cost=copy.deepcopy(switch_cost))
+            parts.append((k, k + 1, state.completion_sum, state.cs, state.last_pid, state.time))
+        return parts
+
+    def finish(state, lo, hi):
+        if state.queue:
+            _advance(state, pids, arrival, quanta[lo], switch_cost=switch_cost)
+        parts.append((lo, hi, state.completion_sum, state.cs, state.last_pid, state.time))
+
+    state = _RRState(arrival, burst)
+    lo, hi = 0, len(quanta)
+    while hi - lo > 1 and state.queue:
+        # every quantum in quanta[lo:hi] runs whole bursts up to quanta[lo]
+        _advance(state, pids, arrival, quanta[lo], limit=quanta[lo], switch_cost=switch_cost)
+        if not state.queue:
+            break
+        split = min(bisect_left(quanta, state.remaining[state.queue[0]], lo, hi), hi - 1)
+        # the smaller quanta go their own way; each is finished before the
+        # next one is split off, so at most one copy of the state is alive
+        for k in range(lo, split):
+            finish(state.copy(), k, k + 1)
+        lo = split
+    finish(state, lo, hi)
+    return parts
+
+def sweep_metrics(processes, q_values, switch_cost=0):
+    """Same points as quantum_point() for every q, sharing work between quanta.
+
+    Without a switch cost the busy periods (stretches of CPU time between
+    idle gaps) are the same for every quantum, and each one is swept on
+    its own. Inside a busy period, a slice only depends on the quantum
+    when the dispatched process has more than q units left. So all quanta
+    at or above the longest remaining burst seen so far follow one
+    schedule. That group is simulated once, and a quantum is split off
+    (from a copy of the state) only where its schedule diverges. At the
+    next idle gap, all quanta are back on one schedule.
+
+    The cost of a quantum is therefore the busy periods whose schedule it
+    changes, not the whole trace. A quantum at or above a period's longest
+    burst adds nothing there, and per-quantum totals are kept as
+    difference arrays. With a switch cost, busy periods depend on the
+    quantum, so only the common prefix of the whole trace is shared. A
+    callable (sampled) cost shares nothing: every quantum gets its own
+    copy of the sampler, so its point matches quantum_point() with a
+    fresh sampler of the same seed.
+    """
+    processes = sorted(processes, key=lambda x: x[1])
+    n = len(processes)
+    pids = [p[0] for p in processes]
+    arrival = [p[1] for p in processes]
+    burst = [p[2] for p in processes]
+    quanta = sorted(set(q_values))
+    m = len(quanta)
+    if switch_cost or any(bt <= 0 for bt in burst):
+        periods = [(0, n)] if n else []
+    else:
+        periods = _busy_periods(arrival, burst)
+
+    # per-quantum completion-time sums and switch counts, as difference arrays
+    d_sum = [0] * (m + 1)
+    d_cs = [0] * (m + 1)
+    end_time = [0] * m
+    parts = []
+    for start, stop in periods:
+        for lo, hi, _, _, last_pid, _ in parts:
+            # the first dispatch of this period switches away from the last
+            # process of the previous one
+            if last_pid != pids[start]:
+                d_cs[lo] += 1
+                d_cs[hi] -= 1
+        parts = _sweep_period(pids[start:stop], arrival[start:stop], burst[start:stop], quanta, switch_cost)
+        for lo, hi, completion_sum, cs, _, _ in parts:
+            d_sum[lo] += completion_sum
+            d_sum[hi] -= completion_sum
+            d_cs[lo] += cs
+            d_cs[hi] -= cs
+    for lo, hi, _, _, _, time in parts:
+        end_time[lo:hi] = [time] * (hi - lo)
+
+    arrival_sum = sum(arrival)
+    burst_sum = sum(burst)
+    metrics = {}
+    completion_sum = cs = 0
+    for k, q in enumerate(quanta):
+        completion_sum += d_sum[k]
+        cs += d_cs[k]
+        if n:
+            avg_tat = (completion_sum - arrival_sum) / n
+            avg_wt = (completion_sum - arrival_sum - burst_sum) / n
+        else:
+            avg_tat = avg_wt = 0
+        throughput = (n / end_time[k]) if n and end_time[k] > 0 else 0
+        metrics[q] = (q, avg_wt, avg_tat, cs, throughput)
+    return [metrics[q] for q in q_values]
+
+def _sweep_chunk(processes, q_values, switch_cost):
+    return sweep_metrics(processes, q_values, switch_cost)
+
+def quantum_range(start, stop, step=1):
+    # inclusive of stop, like the GUI fields
+    if start <= 0 or step <= 0:
+        raise ValueError("Quantum start and step must be positive integers.")
+    if stop < start:
+        raise ValueError("Quantum end must not be smaller than quantum start.")
+    return list(range(start, stop + 1, step))
+
+class PoolRun:
+    """Non-blocking fan-out of chunked jobs to a pool of worker processes.
+
+    Subclasses list their jobs in _jobs() as (fn, args) pairs, where each
+    fn returns a list of results and fn and args are picklable. start()
+    submits them, poll() returns the results of jobs finished since the
+    last call and cancel() drops everything not yet started. poll()
+    re-raises an exception from a worker, so callers should cancel the
+    run when it does.
+    """
+
+    def __init__(self, workers=None, chunks_per_worker=4):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunks_per_worker = chunks_per_worker
+        self.completed = 0
+        self.cancelled = False
+        self._executor = None
+        self._pending = []
+
+    @property
+    def total(self):
+        raise NotImplementedError
+
+    @property
+    def done(self):
+        return self.cancelled or not self._pending
+
+    def _jobs(self):
+        raise NotImplementedError
+
+    def start(self):
+        jobs = self._jobs()
+        if not jobs:
+            return self
+        ctx = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx)
+        self._pending = [self._executor.submit(fn, *args) for fn, args in jobs]
+        return self
+
+    def poll(self):
+        if self.cancelled:
+            return []
+        finished, pending = [], []
+        for f in self._pending:
+            (finished if f.done() else pending).append(f)
+        if not finished:
+            return []
+        self._pending = pending
+        results = []
+        for f in finished:
+            results.extend(f.result())
+        self.completed += len(results)
+        if not self._pending:
+            self._executor.shutdown(wait=False)
+        return results
+
+    def wait(self, timeout=None):
+        # block until at least one more job has finished, then poll()
+        if self._pending:
+            wait(self._pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        return self.poll()
+
+    def cancel(self):
+        self.cancelled = True
+        self._pending = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+class QuantumSweep(PoolRun):
+    """Runs quantum_point() for many quanta on a pool of worker processes.
+
+    poll() returns whatever (quantum, avg_wt, avg_tat, cs, throughput)
+    points have finished since the last call. A callable switch_cost has
+    to be picklable to reach the workers.
+    """
+
+    def __init__(self, processes, q_values, workers=None, chunks_per_worker=4, switch_cost=0):
+        super().__init__(workers, chunks_per_worker)
+        self.processes = list(processes)
+        self.q_values = list(q_values)
+        self.switch_cost = switch_cost
+
+    @property
+    def total(self):
+        return len(self.q_values)
+
+    def _chunks(self):
+        # several chunks per worker so results stream back while the sweep runs
+        n_chunks = max(1, min(len(self.q_values), self.workers * self.chunks_per_worker))
+        return [self.q_values[k::n_chunks] for k in range(n_chunks)]
+
+    def _jobs(self):
+        if not self.q_values:
+            return []
+        return [(_sweep_chunk, (self.processes, chunk, self.switch_cost)) for chunk in self._chunks()]
+
+def cached_points(cache, processes, q_values, switch_cost=0):
+    """Split a sweep into the points a ResultCache already holds and the rest.
+
+    Returns (points, missing quanta, key) where key(q) is the cache key to
+    store a newly computed point under.
+    """
+    workload = workload_key(processes)
+    key = lambda q: cache_key(workload, "point", q, switch_cost)
+    points, missing = [], []
+    for q in q_values:
+        point = cache.get(key(q))
+        if point is None:
+            missing.append(q)
+        else:
+            points.append(point)
+    return points, missing, key
+
+def run_sweep(processes, q_values, workers=None, switch_cost=0, cache=None):
+    # blocking convenience wrapper for scripts; results sorted by quantum.
+    # With a ResultCache only the quanta it does not hold yet are simulated.
+    if cache is not None:
+        points, missing, key = cached_points(cache, processes, q_values, switch_cost)
+    else:
+        points, missing = [], q_values
+    sweep = QuantumSweep(processes, missing, workers, switch_cost=switch_cost).start()
+    while not sweep.done:
+        new = sweep.wait()
+        if cache is not None:
+            for point in new:
+                cache.put(key(point[0]), point)
+        points.extend(new)
+    return sorted(points)
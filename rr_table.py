@@ -0,0 +1,137 @@
+"""Virtualized results table for the Tk GUI.
+
+The ttk.Treeview only ever holds as many items as fit on screen. Scrolling
+rewrites the values of those items from the data source instead of
+inserting one item per process. Refreshing the table is O(visible rows)
+whatever the result size. Sorting by a column only builds a row
+permutation and never touches Tk items.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+class VirtualTable:
+    def __init__(self, parent, columns, height=8, rowheight=26, widths=None, anchors=None):
+        self.columns = tuple(columns)
+        self.rowheight = rowheight
+        self.frame = tk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=self.columns, show="headings", height=height)
+        self.vsb = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.vsb.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        widths = widths or {}
+        anchors = anchors or {}
+        for c in self.columns:
+            self.tree.heading(c, text=c, command=lambda c=c: self.sort_by(c))
+            self.tree.column(c, width=widths.get(c, 100), anchor=anchors.get(c, "center"))
+
+        self.count = 0
+        self.row = None        # row(i) -> tuple of display values
+        self.sort_keys = {}    # column -> sequence indexable by row number
+        self.order = None      # current permutation of rows, None = natural order
+        self.sort_column = None
+        self.descending = False
+        self.offset = 0
+        self.visible = height
+        self._items = []
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self._scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self._scroll(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self._scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self._scroll(1, "pages"))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def tag_configure(self, tag, **kwargs):
+        self.tree.tag_configure(tag, **kwargs)
+
+    def set_rows(self, count, row, sort_keys=None):
+        """Show `count` rows; row(i) returns the display values of row i.
+
+        sort_keys maps column names to sequences of sortable values; columns
+        without one sort by their displayed value.
+        """
+        self.count = count
+        self.row = row
+        self.sort_keys = sort_keys or {}
+        self.order = None
+        self.sort_column = None
+        self.descending = False
+        self.offset = 0
+        self._sync_items()
+        self.refresh()
+
+    def clear(self):
+        self.set_rows(0, None)
+
+    def sort_by(self, column):
+        if not self.count:
+            return
+        if column == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        keys = self.sort_keys.get(column)
+        if keys is None:
+            col = self.columns.index(column)
+            row = self.row
+            key = lambda i: row(i)[col]
+        else:
+            key = keys.__getitem__
+        self.order = sorted(range(self.count), key=key, reverse=self.descending)
+        self.offset = 0
+        self.refresh()
+
+    def refresh(self):
+        order = self.order
+        for slot, iid in enumerate(self._items):
+            i = self.offset + slot
+            if order is not None:
+                i = order[i]
+            tag = 'evenrow' if (self.offset + slot) % 2 == 0 else 'oddrow'
+            self.tree.item(iid, values=tuple(str(v) for v in self.row(i)), tags=(tag,))
+        if self.count:
+            self.vsb.set(self.offset / self.count, min(1.0, (self.offset + len(self._items)) / self.count))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _sync_items(self):
+        # keep exactly min(count, visible) Tk items alive
+        wanted = min(self.count, self.visible)
+        while len(self._items) > wanted:
+            self.tree.delete(self._items.pop())
+        while len(self._items) < wanted:
+            self._items.append(self.tree.insert("", "end", values=()))
+
+    def _max_offset(self):
+        return max(0, self.count - self.visible)
+
+    def _scroll(self, amount, what):
+        step = amount * (max(1, self.visible - 1) if what == "pages" else 1)
+        offset = min(max(0, self.offset + step), self._max_offset())
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            offset = min(max(0, int(float(args[1]) * self.count)), self._max_offset())
+            if offset != self.offset:
+                self.offset = offset
+                self.refresh()
+        elif args[0] == "scroll":
+            self._scroll(int(args[1]), args[2])
+
+    def _on_configure(self, event):
+        # header row takes roughly one row height
+        visible = max(1, event.height // self.rowheight - 1)
+        if visible != self.visible:
+            self.visible = visible
+            self.offset = min(self.offset, self._max_offset())
+            self._sync_items()
+            if self.row is not None:
+                self.refresh()
@@ -0,0 +1,85 @@
+"""Run GUI work on a background thread and hand results back by polling.
+
+Tk widgets may only be touched from the main thread, so a BackgroundTask
+never calls back into the GUI itself. The worker posts progress, its
+result or its exception on a queue, and the GUI drains that queue from a
+root.after() loop with poll(). No tkinter imports here.
+"""
+import queue
+import threading
+
+class Cancelled(Exception):
+    pass
+
+class BackgroundTask:
+    """fn(task, *args, **kwargs) on a daemon thread.
+
+    fn may call task.report(completed, total, text) to publish progress
+    and task.check() at safe points to stop early once cancel() has been
+    called. It can also pass task.progress to rr_instrument.Instrument, or
+    as simulate()'s or round_robin_smp()'s progress, so that progress
+    reports and cancel checks happen inside the simulation loop.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.done = False
+        self.result = None
+        self.error = None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            result = self.fn(self, *self.args, **self.kwargs)
+        except Cancelled:
+            self.events.put(("cancelled", None))
+        except Exception as e:
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", result))
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def check(self):
+        if self.cancelled.is_set():
+            raise Cancelled()
+
+    def report(self, completed, total=None, text=None):
+        self.check()
+        self.events.put(("progress", (completed, total, text)))
+
+    def progress(self, completed, total, sim_time):
+        # Instrument(progress=task.progress) callback
+        self.report(completed, total, f"t={sim_time}")
+
+    def poll(self):
+        """Drain the event queue from the GUI thread.
+
+        Returns the latest progress (completed, total, text) or None. When
+        the worker finishes, sets done and either result or error (a
+        Cancelled instance if it stopped after cancel()).
+        """
+        latest = None
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                return latest
+            if kind == "progress":
+                latest = value
+            elif kind == "done":
+                self.done, self.result = True, value
+            elif kind == "cancelled":
+                self.done, self.error = True, Cancelled()
+            else:
+                self.done, self.error = True, value
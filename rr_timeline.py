@@ -0,0 +1,200 @@
+"""Compact Gantt timeline storage.
+
+A Timeline holds a schedule as three parallel arrays (PID index, start,
+end) plus one table of PID names, in place of a list of (pid, start, end)
+tuples. It still behaves like that list: you can index it, iterate it,
+append to it and assign its last item. That makes it a drop-in for
+round_robin(), compute_extra_metrics() and show_gantt().
+
+save()/load() use a small binary format. load() memory-maps the file, so
+even very large schedules can be replayed and re-analyzed without
+simulating them again or reading them fully into memory.
+
+File layout (little-endian):
+    header   "RRTL", version u16, time typecode (b"q" or b"d"), pad u8,
+             segments u64, PID table bytes u64
+    PID table  JSON list of names, padded to 8 bytes
+    index      int32 x segments, padded to 8 bytes
+    start      int64/float64 x segments
+    end        int64/float64 x segments
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+# PID of the context-switch overhead segments (re-exported by rr_core)
+SWITCH = "<cs>"
+
+MAGIC = b"RRTL"
+VERSION = 1
+_HEADER = struct.Struct("<4sHcxQQ")
+
+def _pad(n):
+    return -n % 8
+
+class Timeline:
+    def __init__(self, pids=(), typecode="q"):
+        if typecode not in ("q", "d"):
+            raise ValueError("typecode must be 'q' (integer times) or 'd' (float times)")
+        self.typecode = typecode
+        self.pids = []
+        self._pid_index = {}
+        for pid in pids:
+            self._intern(pid)
+        self.index = array("i")
+        self.start = array(typecode)
+        self.end = array(typecode)
+        self._mmap = None
+
+    @classmethod
+    def from_gantt(cls, gantt):
+        typecode = "q" if all(type(s) is int and type(e) is int for _, s, e in gantt) else "d"
+        timeline = cls(typecode=typecode)
+        timeline.extend(gantt)
+        return timeline
+
+    def _intern(self, pid):
+        idx = self._pid_index.get(pid)
+        if idx is None:
+            idx = self._pid_index[pid] = len(self.pids)
+            self.pids.append(pid)
+        return idx
+
+    # list-of-tuples protocol
+    def __len__(self):
+        return len(self.index)
+
+    def __bool__(self):
+        return len(self.index) > 0
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        return (self.pids[self.index[k]], self.start[k], self.end[k])
+
+    def __setitem__(self, k, segment):
+        pid, start, end = segment
+        self.index[k] = self._intern(pid)
+        self.start[k] = start
+        self.end[k] = end
+
+    def __iter__(self):
+        pids = self.pids
+        for idx, start, end in zip(self.index, self.start, self.end):
+            yield (pids[idx], start, end)
+
+    def __eq__(self, other):
+        if isinstance(other, Timeline):
+            other = list(other)
+        return isinstance(other, list) and list(self) == other
+
+    def append(self, segment):
+        pid, start, end = segment
+        self.index.append(self._intern(pid))
+        self.start.append(start)
+        self.end.append(end)
+
+    def extend(self, segments):
+        for segment in segments:
+            self.append(segment)
+
+    def to_list(self):
+        return list(self)
+
+    @property
+    def nbytes(self):
+        return sum(len(col) * col.itemsize for col in (self.index, self.start, self.end))
+
+    def run_length_encoded(self):
+        # merge back-to-back segments of the same process; switch segments
+        # are kept as they are
+        out = Timeline(self.pids, self.typecode)
+        switch = self._pid_index.get(SWITCH, -1)
+        for idx, start, end in zip(self.index, self.start, self.end):
+            if out.index and out.index[-1] == idx and idx != switch and out.end[-1] == start:
+                out.end[-1] = end
+            else:
+                out.index.append(idx)
+                out.start.append(start)
+                out.end.append(end)
+        return out
+
+    def context_switches(self):
+        # changes of process between real segments, as round_robin() counts them
+        switch = self._pid_index.get(SWITCH, -1)
+        count = 0
+        last = None
+        for idx in self.index:
+            if idx == switch:
+                continue
+            if last is not None and idx != last:
+                count += 1
+            last = idx
+        return count
+
+    # binary format
+    def save(self, path):
+        table = json.dumps(self.pids).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.typecode.encode(), len(self), len(table)))
+            f.write(table + b"\0" * _pad(len(table)))
+            for col in (self.index, self.start, self.end):
+                data = _little_endian(col)
+                f.write(data)
+                f.write(b"\0" * _pad(len(data)))
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a saved timeline. The result is read-only and is
+        backed by the file until close() (or the end of a with block)."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, typecode, count, table_len = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION:
+            mm.close()
+            raise ValueError(f"{path} is not a version {VERSION} timeline file")
+        typecode = typecode.decode()
+        offset = _HEADER.size
+        timeline = cls(json.loads(mm[offset:offset + table_len].decode("utf-8")), typecode)
+        offset += table_len + _pad(table_len)
+
+        view = memoryview(mm)
+        columns = []
+        for code, size in (("i", 4), (typecode, 8), (typecode, 8)):
+            nbytes = count * size
+            col = view[offset:offset + nbytes].cast(code)
+            if sys.byteorder != "little":
+                col = array(code, col)
+                col.byteswap()
+            columns.append(col)
+            offset += nbytes + _pad(nbytes)
+        timeline.index, timeline.start, timeline.end = columns
+        timeline._mmap = mm
+        return timeline
+
+    def close(self):
+        # release a memory-mapped timeline; it is empty afterwards
+        if self._mmap is not None:
+            for col in (self.index, self.start, self.end):
+                if isinstance(col, memoryview):
+                    col.release()
+            self.index = array("i")
+            self.start = array(self.typecode)
+            self.end = array(self.typecode)
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _little_endian(col):
+    if sys.byteorder == "little":
+        return col.tobytes() if isinstance(col, array) else bytes(col)
+    swapped = array(col.typecode if isinstance(col, array) else col.format, col)
+    swapped.byteswap()
+    return swapped.tobytes()
@@ -0,0 +1,83 @@
+"""Seeded workload generators for benchmarks and experiments.
+
+Every generator returns a list of ("P1", arrival, burst) tuples, the same
+shape the GUI builds, with integer times. Equal seeds give equal workloads.
+
+* uniform - arrivals and bursts drawn uniformly, like "Random Example"
+* pareto  - heavy-tailed bursts: most jobs are short, a few are very long
+* bursty  - arrivals come in clumps separated by quiet gaps
+"""
+import random
+
+def arrival_span(n, mean_burst, load=1.0):
+    # arrival window that keeps the CPU about `load` busy on average
+    if load <= 0:
+        raise ValueError("load must be positive.")
+    return max(0, round(n * mean_burst / load))
+
+def uniform(n, seed=None, max_burst=10, max_arrival=5):
+    """Arrivals in 0..max_arrival, bursts in 1..max_burst."""
+    rng = random.Random(seed)
+    return [("P" + str(i + 1), rng.randint(0, max_arrival), rng.randint(1, max_burst)) for i in range(n)]
+
+def pareto(n, seed=None, alpha=1.5, min_burst=1, max_burst=1000, max_arrival=5):
+    """Pareto(alpha) bursts scaled by min_burst and capped at max_burst.
+
+    alpha <= 2 gives infinite variance: the longest jobs dominate the
+    total work, which is where RR and the fast paths are stressed most.
+    """
+    if alpha <= 0:
+        raise ValueError("alpha must be positive.")
+    rng = random.Random(seed)
+    procs = []
+    for i in range(n):
+        at = rng.randint(0, max_arrival)
+        bt = min(max_burst, int(min_burst * rng.paretovariate(alpha)))
+        procs.append(("P" + str(i + 1), at, max(1, bt)))
+    return procs
+
+def bursty(n, seed=None, max_burst=10, mean_clump=20, mean_gap=50):
+    """Clumps of about mean_clump simultaneous arrivals, mean_gap apart.
+
+    Clump sizes are geometric and gaps exponential, so the ready queue
+    swings between empty and long.
+    """
+    if mean_clump < 1:
+        raise ValueError("mean_clump must be at least 1.")
+    rng = random.Random(seed)
+    procs = []
+    at = 0
+    while len(procs) < n:
+        clump = 1
+        while clump < n - len(procs) and rng.random() > 1 / mean_clump:
+            clump += 1
+        for _ in range(clump):
+            procs.append(("P" + str(len(procs) + 1), at, rng.randint(1, max_burst)))
+        at += 1 + (int(rng.expovariate(1 / mean_gap)) if mean_gap > 0 else 0)
+    return procs
+
+WORKLOADS = {"uniform": uniform, "pareto": pareto, "bursty": bursty}
+
+def make_workload(kind, n, seed=None, load=None, **options):
+    """Build a workload by name.
+
+    load, if given, spreads arrivals so the CPU is about that busy on
+    average (uniform and pareto scale max_arrival, bursty scales the gap).
+    Other keyword options go to the generator.
+    """
+    if kind not in WORKLOADS:
+        raise ValueError(f"Unknown workload {kind!r}; choose one of {', '.join(WORKLOADS)}.")
+    if load is not None:
+        if kind == "uniform":
+            mean_burst = (1 + options.get("max_burst", 10)) / 2
+            options.setdefault("max_arrival", arrival_span(n, mean_burst, load))
+        elif kind == "pareto":
+            alpha = options.get("alpha", 1.5)
+            # mean of the uncapped distribution; the cap only lowers it
+            mean_burst = options.get("min_burst", 1) * (alpha / (alpha - 1) if alpha > 1 else 10)
+            options.setdefault("max_arrival", arrival_span(n, mean_burst, load))
+        else:
+            mean_burst = (1 + options.get("max_burst", 10)) / 2
+            mean_clump = options.get("mean_clump", 20)
+            options.setdefault("mean_gap", max(0, arrival_span(mean_clump, mean_burst, load) - 1))
+    return WORKLOADS[kind](n, seed=seed, **options)
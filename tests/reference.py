@@ -0,0 +1,108 @@
+"""The original list-rescanning round_robin(), kept as a reference.
+
+differential_check() runs an engine and this reference on random small
+workloads and compares every result field, the Gantt chart included.
+"""
+import random
+
+from rr_core import _append_merged, round_robin
+
+def round_robin_reference(processes, quantum):
+    processes = sorted(processes, key=lambda x: x[1])
+    n = len(processes)
+    remaining = [bt for _, _, bt in processes]
+    completion = [0] * n
+    first_response = [-1] * n
+    time = 0
+    queue = []
+    visited = [False] * n
+    gantt = []
+
+    if processes and processes[0][1] > 0:
+        time = processes[0][1]
+
+    for idx in range(n):
+        if processes[idx][1] <= time and not visited[idx]:
+            queue.append(idx)
+            visited[idx] = True
+
+    if not queue:
+        for idx in range(n):
+            if not visited[idx]:
+                time = processes[idx][1]
+                queue.append(idx)
+                visited[idx] = True
+                break
+
+    while queue:
+        i = queue.pop(0)
+        if first_response[i] == -1:
+            first_response[i] = time - processes[i][1]
+
+        run_time = min(remaining[i], quantum)
+        start = time
+        end = time + run_time
+        gantt.append((processes[i][0], start, end))
+
+        time = end
+        remaining[i] -= run_time
+
+        for j in range(n):
+            if processes[j][1] <= time and not visited[j] and remaining[j] > 0:
+                queue.append(j)
+                visited[j] = True
+
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = time
+
+        if not queue:
+            for k in range(n):
+                if remaining[k] > 0 and not visited[k]:
+                    time = processes[k][1]
+                    queue.append(k)
+                    visited[k] = True
+                    break
+
+    tat = [completion[i] - processes[i][1] for i in range(n)]
+    wt = [tat[i] - processes[i][2] for i in range(n)]
+    rt = [first_response[i] for i in range(n)]
+
+    cs = 0
+    for idx in range(1, len(gantt)):
+        if gantt[idx][0] != gantt[idx - 1][0]:
+            cs += 1
+
+    return processes, completion, tat, wt, rt, gantt, cs
+
+def random_workload(rng):
+    n = rng.randint(0, 12)
+    # small arrival range so ties, bursts of arrivals and idle gaps all occur
+    span = rng.choice([0, 3, 10, 40])
+    return [("P" + str(i + 1), rng.randint(0, span), rng.randint(1, 15)) for i in range(n)]
+
+def differential_check(engine=None, trials=500, seed=0):
+    """Run `engine` and the reference implementation on random workloads.
+
+    Raises AssertionError on the first mismatch; returns the number of
+    (workload, quantum) pairs compared.
+    """
+    engine = engine or round_robin
+    rng = random.Random(seed)
+    checked = 0
+    for _ in range(trials):
+        processes = random_workload(rng)
+        for q in (1, 2, 3, rng.randint(1, 20)):
+            got = engine(processes, q)
+            want = round_robin_reference(processes, q)
+            assert got == want, f"mismatch for quantum={q}, processes={processes!r}"
+            if engine is round_robin:
+                merged = []
+                for seg in want[5]:
+                    _append_merged(merged, *seg)
+                compressed = round_robin(processes, q, compress=True)
+                assert compressed[5] == merged and compressed[:5] + compressed[6:] == want[:5] + want[6:], \
+                    f"compressed mismatch for quantum={q}, processes={processes!r}"
+            checked += 1
+    return checked
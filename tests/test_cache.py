@@ -0,0 +1,44 @@
+from rr_cache import ResultCache, cache_key, workload_key
+from rr_core import switch_cost_sampler
+
+def test_lru_evicts_by_count():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert "b" not in cache and cache.get("a") == 1 and cache.get("c") == 3
+
+def test_lru_evicts_by_size():
+    cache = ResultCache(max_bytes=10000)
+    for k in range(10):
+        cache.put(str(k), list(range(100)))
+    assert 0 < len(cache) < 10
+    assert cache.stats()["bytes"] <= 10000
+    assert "9" in cache and "0" not in cache
+    cache.put("huge", list(range(10000)))  # bigger than the whole tier
+    assert "huge" not in cache
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    ResultCache(disk_dir=str(tmp_path)).put("k", ("result", [1, 2, 3]))
+    cache = ResultCache(disk_dir=str(tmp_path))
+    assert cache.get("k") == ("result", [1, 2, 3])
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.get("k") == ("result", [1, 2, 3])
+    assert cache.stats()["hits"] == 1
+
+def test_disk_tier_skips_what_does_not_fit(tmp_path):
+    cache = ResultCache(disk_dir=str(tmp_path), disk_max_bytes=1000)
+    cache.put("big", list(range(1000)))
+    cache.put("small", 7, disk=False)
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get("big") is not None  # still served from memory
+
+def test_callable_parameters_are_never_cached():
+    key = cache_key(workload_key([("P1", 0, 3)]), "RR", 2, switch_cost_sampler("uniform", 1, seed=0))
+    assert key is None
+    cache = ResultCache()
+    calls = []
+    for _ in range(2):
+        cache.get_or_compute(key, lambda: calls.append(1) or len(calls))
+    assert calls == [1, 1] and len(cache) == 0
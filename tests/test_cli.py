@@ -0,0 +1,29 @@
+import io
+
+import pytest
+
+from rr_cli import main, read_trace
+
+def test_jsonl_and_csv_keep_fractional_times():
+    jsonl = io.StringIO('{"pid": "A", "arrival": 0.5, "burst": 2.7}\n{"pid": "B", "arrival": 1, "burst": 0.7}\n')
+    csv_text = io.StringIO("pid,arrival,burst\nA,0.5,2.7\nB,1,0.7\n")
+    want = [("A", 0.5, 2.7), ("B", 1, 0.7)]
+    assert list(read_trace(jsonl, "jsonl")) == want
+    assert list(read_trace(csv_text, "csv")) == want
+
+def test_missing_trace_is_an_error_not_a_traceback(tmp_path, capsys):
+    assert main([str(tmp_path / "missing.csv"), "-q", "2"]) == 2
+    assert "error:" in capsys.readouterr().err
+
+def test_non_finite_times_are_rejected():
+    for text in ('{"arrival": "inf", "burst": 2}\n', '{"arrival": 0, "burst": NaN}\n'):
+        with pytest.raises(ValueError, match="line 1: .*finite"):
+            list(read_trace(io.StringIO(text), "jsonl"))
+    with pytest.raises(ValueError, match="line 3: .*finite"):
+        list(read_trace(io.StringIO("pid,arrival,burst\nA,0,1\nB,nan,2\n"), "csv"))
+
+def test_jsonl_line_must_be_an_object():
+    with pytest.raises(ValueError, match="line 2: expected a JSON object"):
+        list(read_trace(io.StringIO('{"arrival": 0, "burst": 1}\n[1, 2]\n'), "jsonl"))
+    with pytest.raises(ValueError, match="line 1: invalid JSON"):
+        list(read_trace(io.StringIO('{"arrival": 0,\n'), "jsonl"))
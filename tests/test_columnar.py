@@ -0,0 +1,12 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rr_columnar import ProcessTable  # noqa: E402
+from rr_policies import Priority, simulate  # noqa: E402
+
+def test_from_result_accepts_priority_processes():
+    result = simulate([("A", 0, 4, 2), ("B", 1, 3, 1), ("C", 2, 2, 0)], Priority())
+    table = ProcessTable.from_result(*result[:5])
+    assert list(table.wt) == result[3]
+    assert list(table.pids) == ["A", "B", "C"]
@@ -0,0 +1,58 @@
+import io
+import math
+
+import pytest
+
+from rr_cache import ResultCache
+from rr_compare import COLUMNS, ComparisonTable, cached_cells, cell_metrics, parse_quanta
+
+PROCS = [("P1", 0, 5), ("P2", 1, 3), ("P3", 2, 8), ("P4", 3, 6)]
+
+def _rows(workload, processes, q_values):
+    return [dict(cell_metrics(processes, q), workload=workload) for q in q_values]
+
+def test_parse_quanta_ranges_and_lists():
+    assert parse_quanta("4-64:4") == list(range(4, 65, 4))
+    assert parse_quanta("8, 2 1-3  2") == [1, 2, 3, 8]
+    assert parse_quanta("5-5") == [5]
+
+@pytest.mark.parametrize("text", ["", "x", "4-", "1-8:a", "2.5", "0", "1-8:0", "8-1", "-3"])
+def test_parse_quanta_rejects_bad_tokens(text):
+    with pytest.raises(ValueError):
+        parse_quanta(text)
+
+def test_best_prefers_the_smallest_quantum_on_ties():
+    table = ComparisonTable([
+        {"workload": "w", "quantum": 8, "avg_wt": 2.0, "throughput": 0.5},
+        {"workload": "w", "quantum": 2, "avg_wt": 2.0, "throughput": 0.5},
+        {"workload": "w", "quantum": 4, "avg_wt": 3.0, "throughput": 0.4},
+    ])
+    assert table.best("avg_wt")["w"]["quantum"] == 2
+    assert table.best("throughput")["w"]["quantum"] == 2
+
+def test_csv_columns_and_row_order():
+    table = ComparisonTable(_rows("b", PROCS, [4, 1]) + _rows("a", PROCS, [2]))
+    out = io.StringIO()
+    table.to_csv(out)
+    lines = out.getvalue().splitlines()
+    assert tuple(lines[0].split(",")) == COLUMNS
+    # workloads in first-seen order, quanta ascending within each
+    assert [tuple(line.split(",")[:2]) for line in lines[1:]] == [("b", "1"), ("b", "4"), ("a", "2")]
+
+def test_matrix_marks_missing_cells():
+    table = ComparisonTable(_rows("a", PROCS, [1, 2]) + _rows("b", PROCS, [2]))
+    workloads, quanta, grid = table.matrix("cs")
+    assert workloads == ["a", "b"] and quanta == [1, 2]
+    assert grid[0] == [table.cell("a", 1)["cs"], table.cell("a", 2)["cs"]]
+    assert math.isnan(grid[1][0]) and grid[1][1] == table.cell("b", 2)["cs"]
+
+def test_cached_cells_split_and_survive_renames():
+    cache = ResultCache()
+    rows, missing, key = cached_cells(cache, {"a": PROCS}, [1, 2, 4])
+    assert rows == [] and missing == {"a": [1, 2, 4]}
+    for row in _rows("a", PROCS, [1, 4]):
+        cache.put(key("a", row["quantum"]), row)
+    other = [("Q1", 0, 2)]
+    rows, missing, _ = cached_cells(cache, {"renamed": PROCS, "other": other}, [1, 2, 4])
+    assert [(r["workload"], r["quantum"]) for r in rows] == [("renamed", 1), ("renamed", 4)]
+    assert missing == {"renamed": [2], "other": [1, 2, 4]}
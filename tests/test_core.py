@@ -0,0 +1,5 @@
+from reference import differential_check
+
+def test_round_robin_matches_reference():
+    # plain and compressed Gantt modes against the list-rescanning original
+    assert differential_check(trials=500, seed=0) == 2000
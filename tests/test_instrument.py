@@ -0,0 +1,36 @@
+import random
+
+from reference import differential_check, random_workload
+from rr_core import round_robin, switch_cost_sampler
+from rr_instrument import Instrument
+
+def test_instrumented_engine_matches_reference():
+    engine = lambda processes, q: round_robin(processes, q, instrument=Instrument(timers=True))
+    assert differential_check(engine, trials=300, seed=4) == 1200
+
+def test_instrumented_engine_matches_plain_engine():
+    # compressed Gantt and switch costs, which the reference does not model
+    rng = random.Random(5)
+    for _ in range(500):
+        processes = random_workload(rng)
+        q, compress = rng.randint(1, 6), rng.random() < 0.5
+        cost = rng.choice([0, 1, 2.5])
+        want = round_robin(processes, q, compress=compress, switch_cost=cost)
+        got = round_robin(processes, q, compress=compress, switch_cost=cost, instrument=Instrument())
+        assert got == want
+        seed = rng.randrange(1000)
+        want = round_robin(processes, q, switch_cost=switch_cost_sampler("exponential", 1.5, seed))
+        got = round_robin(processes, q, switch_cost=switch_cost_sampler("exponential", 1.5, seed),
+                          instrument=Instrument())
+        assert got == want
+
+def test_reused_instrument_reports_the_latest_run():
+    instrument = Instrument()
+    processes = [("A", 0, 5), ("B", 1, 3), ("C", 2, 8)]
+    round_robin(processes, 2, instrument=instrument)
+    first = instrument.as_dict()
+    round_robin(processes, 2, instrument=instrument)
+    again = instrument.as_dict()
+    first.pop("wall_s"), again.pop("wall_s")
+    assert again == first
+    assert again["completed"] == again["processes"] == 3
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from reference import random_workload
+from rr_core import SWITCH, round_robin
+from rr_policies import MLFQ, Priority, RoundRobin, FCFS, SJF, SRTF, simulate
+
+def _policies():
+    return [RoundRobin(3), FCFS(), SJF(), SRTF(), Priority(), Priority(preemptive=True), MLFQ((2, 4, 8))]
+
+def _check_schedule(processes, result):
+    procs, completion, _, _, _, gantt, _ = result
+    arrival = {p[0]: p[1] for p in procs}
+    ran = dict.fromkeys(arrival, 0)
+    clock = 0
+    for pid, start, end in gantt:
+        assert clock <= start <= end, f"clock runs backwards at {(pid, start, end)} for {processes!r}"
+        clock = end
+        if pid != SWITCH:
+            assert start >= arrival[pid]
+            ran[pid] += end - start
+    assert ran == {p[0]: p[2] for p in procs}, f"bursts not served exactly for {processes!r}"
+
+def test_switch_cost_inside_preemptive_window():
+    # B and C arrive while the switch to B is being paid
+    result = simulate([("A", 0, 9), ("B", 2, 4), ("C", 3, 1)], SRTF(), switch_cost=2)
+    _check_schedule(result[0], result)
+
+def test_policies_keep_invariants_with_switch_cost():
+    rng = random.Random(1)
+    for _ in range(1000):
+        processes = [p + (rng.randint(0, 3),) for p in random_workload(rng)]
+        cost = rng.choice([1, 2, 3, 0.5])
+        for policy in _policies():
+            _check_schedule(processes, simulate(processes, policy, switch_cost=cost))
+
+def test_rr_policy_matches_round_robin():
+    rng = random.Random(2)
+    for _ in range(500):
+        processes = random_workload(rng)
+        q, cost = rng.randint(1, 6), rng.choice([0, 1, 2])
+        assert simulate(processes, RoundRobin(q), switch_cost=cost) == round_robin(processes, q, switch_cost=cost)
+
+def test_progress_reports_and_aborts():
+    processes = [(f"P{k}", k, 3) for k in range(50)]
+    reports = []
+    simulate(processes, RoundRobin(1), progress=lambda *r: reports.append(r), progress_every=10)
+    assert len(reports) == 16 and reports[-1] == (50, 50, 150)
+
+    def stop(completed, total, sim_time):
+        raise KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        simulate(processes, SRTF(), progress=stop, progress_every=5)
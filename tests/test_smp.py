@@ -0,0 +1,57 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from reference import random_workload
+from rr_core import SWITCH, round_robin
+from rr_smp import SMP_MODES, round_robin_smp
+
+def test_one_cpu_matches_round_robin():
+    rng = random.Random(11)
+    for _ in range(300):
+        processes = random_workload(rng)
+        q, cost = rng.randint(1, 6), rng.choice([0, 1, 2.5])
+        procs, completion, tat, wt, rt, gantt, cs = round_robin(processes, q, switch_cost=cost)
+        for mode in SMP_MODES:
+            result = round_robin_smp(processes, q, cpus=1, mode=mode, switch_cost=cost)
+            assert result[:5] == (procs, completion, tat, wt, rt)
+            assert result[5] == [gantt]
+            assert result[6]["cs"] == cs and result[6]["migrations"] == 0
+
+def test_many_cpus_serve_every_burst_once_at_a_time():
+    rng = random.Random(12)
+    for _ in range(300):
+        processes = random_workload(rng)
+        q, cpus = rng.randint(1, 6), rng.randint(2, 4)
+        cost = rng.choice([0, 1])
+        procs, completion, _, _, _, lanes, stats = round_robin_smp(
+            processes, q, cpus, rng.choice(SMP_MODES), switch_cost=cost)
+        served = defaultdict(int)
+        slices = defaultdict(list)
+        for lane in lanes:
+            for k, (pid, start, end) in enumerate(lane):
+                assert start < end and (k == 0 or lane[k - 1][2] <= start)
+                if pid is not SWITCH:
+                    served[pid] += end - start
+                    slices[pid].append((start, end))
+        for pid, arrival, burst in procs:
+            # exactly its burst, never before it arrived
+            assert served[pid] == burst
+            spans = sorted(slices[pid])
+            assert spans[0][0] >= arrival
+            # never on two CPUs at once
+            assert all(a[1] <= b[0] for a, b in zip(spans, spans[1:]))
+        assert completion == [max(end for _, end in slices[p[0]]) for p in procs]
+        assert sum(stats["busy"]) == sum(p[2] for p in procs)
+
+def test_progress_reports_and_aborts():
+    processes = [(f"P{k}", k, 3) for k in range(50)]
+    reports = []
+    round_robin_smp(processes, 1, cpus=2, progress=lambda *r: reports.append(r), progress_every=10)
+    assert len(reports) == 16 and reports[-1][:2] == (50, 50)
+
+    def stop(completed, total, sim_time):
+        raise KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        round_robin_smp(processes, 1, cpus=2, mode="per-cpu", progress=stop, progress_every=5)
@@ -0,0 +1,32 @@
+import random
+
+from reference import random_workload
+from rr_core import percentile, round_robin
+from rr_stream import LogHistogram, OnlineScheduler, StreamSummary, iter_round_robin
+
+def test_batch_loop_matches_online_scheduler_and_core():
+    rng = random.Random(6)
+    for _ in range(1000):
+        processes = sorted(random_workload(rng), key=lambda p: p[1])
+        q = rng.randint(1, 6)
+        batch, online = StreamSummary(), StreamSummary()
+        got = sorted(iter_round_robin(processes, q, batch))
+        scheduler = OnlineScheduler(q, gantt=False, summary=online)
+        assert got == sorted(record for _, record in scheduler.feed(processes))
+        assert batch.as_dict() == online.as_dict()
+        assert batch.cs == round_robin(processes, q)[6]
+
+def test_histogram_percentile_interpolates_like_core():
+    hist = LogHistogram(accuracy=0.01)
+    for x in (5, 6, 7):
+        hist.add(x)
+    assert abs(hist.percentile(99) - percentile([5, 6, 7], 99)) < 0.07
+    rng = random.Random(7)
+    for _ in range(200):
+        values = sorted(rng.choice([0, rng.expovariate(0.01)]) for _ in range(rng.randint(1, 300)))
+        hist = LogHistogram(accuracy=0.01)
+        for x in values:
+            hist.add(x)
+        for p in (50, 95, 99, 100):
+            want = percentile(values, p)
+            assert abs(hist.percentile(p) - want) <= 0.0101 * want + 1e-9
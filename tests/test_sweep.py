@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from reference import random_workload
+from rr_core import switch_cost_sampler
+from rr_sweep import quantum_point, sweep_metrics
+
+def test_shared_sweep_matches_one_run_per_quantum():
+    rng = random.Random(8)
+    for _ in range(300):
+        processes = random_workload(rng)
+        q_values = rng.sample(range(1, 20), rng.randint(1, 8))
+        cost = rng.choice([0, 1, 2])
+        assert sweep_metrics(processes, q_values, cost) == [quantum_point(processes, q, cost) for q in q_values]
+
+def test_sweep_across_idle_gaps():
+    # two busy periods; whether the second starts with a switch depends on
+    # which process the quantum let finish last in the first
+    processes = [("A", 0, 5), ("B", 1, 3), ("A", 20, 2), ("C", 21, 4)]
+    q_values = [10, 1, 2, 3, 4]
+    assert sweep_metrics(processes, q_values) == [quantum_point(processes, q) for q in q_values]
+
+def test_sampled_switch_cost_is_drawn_per_quantum():
+    processes = random_workload(random.Random(3))
+    q_values = [1, 2, 3, 4, 8]
+    swept = sweep_metrics(processes, q_values, switch_cost_sampler("uniform", 1, seed=5))
+    alone = [quantum_point(processes, q, switch_cost_sampler("uniform", 1, seed=5)) for q in q_values]
+    assert [pytest.approx(point) for point in swept] == alone
@@ -0,0 +1,16 @@
+import random
+
+from reference import random_workload
+from rr_core import round_robin
+
+def test_context_switches_skip_switch_segments():
+    rng = random.Random(3)
+    for _ in range(500):
+        processes = random_workload(rng)
+        q, cost = rng.randint(1, 6), rng.choice([0, 1, 2])
+        result = round_robin(processes, q, timeline=True, switch_cost=cost)
+        chart = result[5]
+        assert chart.context_switches() == result[6]
+        compressed = round_robin(processes, q, compress=True, switch_cost=cost)[5]
+        assert list(chart.run_length_encoded()) == compressed
+        assert chart.run_length_encoded().context_switches() == result[6]
@@ -0,0 +1,21 @@
+import pytest
+
+from rr_workloads import WORKLOADS, bursty, make_workload
+
+@pytest.mark.parametrize("kind", WORKLOADS)
+def test_generators_are_seeded_and_well_formed(kind):
+    procs = make_workload(kind, 500, seed=1, load=0.9)
+    assert procs == make_workload(kind, 500, seed=1, load=0.9)
+    assert len(procs) == 500
+    assert [p[0] for p in procs] == [f"P{i + 1}" for i in range(500)]
+    assert all(type(at) is int and type(bt) is int and at >= 0 and bt >= 1 for _, at, bt in procs)
+
+def test_bursty_clumps_are_apart_without_gaps():
+    # mean_gap=0 still moves every clump one unit past the last one
+    procs = bursty(300, seed=2, mean_clump=5, mean_gap=0)
+    times = sorted({at for _, at, _ in procs})
+    assert len(times) > 1 and times == list(range(len(times)))
+
+def test_bursty_arrivals_never_go_back():
+    arrivals = [at for _, at, _ in bursty(1000, seed=3)]
+    assert arrivals == sorted(arrivals)